@@ -15,7 +15,7 @@ from flask_cors import CORS
 import uuid
 
 # Import from the same directory
-from tagger import AudibleTagger
+from tagger import AudibleTagger, _iter_m4b
 from database import AudiobookDatabase
 
 
@@ -119,12 +119,10 @@ class AudiobookAPI:
 
     def find_audiobooks(self, folder: Path) -> List[Path]:
         """Find all .m4b files in the given folder and subfolders"""
-        audiobooks = []
-        if folder.exists():
-            # Use rglob to recursively search for .m4b files
-            for file_path in folder.rglob("*.m4b"):
-                audiobooks.append(file_path)
-        return audiobooks
+        if not folder.exists():
+            return []
+        # scandir walk instead of rglob: no per-entry stat or Path for non-matches
+        return [Path(entry.path) for entry in _iter_m4b(folder)]
 
     def run_cleanup(self):
         """Run automatic cleanup of incoming folder"""
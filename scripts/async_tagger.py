@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Audible Audiobook Tagger
+Looks up every ASIN-tagged book in the incoming folder concurrently using aiohttp
+"""
+
+import asyncio
+import io
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from tqdm.contrib.logging import logging_redirect_tqdm
+
+from tagger import AudibleTagger, _RESPONSE_GROUPS, _loads
+
+
+class AsyncAudibleTagger(AudibleTagger):
+    """AudibleTagger whose Audible API and cover requests run on asyncio.
+
+    Parsing, caching, tagging and moving are shared with AudibleTagger; blocking
+    disk work is pushed to threads so lookups for other books keep flowing. Use
+    it as an async context manager so the HTTP session is opened and closed:
+
+        async with AsyncAudibleTagger() as tagger:
+            await tagger.run_async()
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.http: Optional[aiohttp.ClientSession] = None
+        self._cover_slots: Optional[asyncio.Semaphore] = None
+        # ASIN -> in-flight cover download, so each cover is fetched once
+        self._cover_downloads: Dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "AsyncAudibleTagger":
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8),
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+        # Cap concurrent cover downloads like the threaded tagger does
+        self._cover_slots = asyncio.Semaphore(8)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.http.close()
+        self.http = None
+        self.close()
+
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """GET an Audible API URL and decode the JSON body"""
+        async with self.http.get(url, params=params) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+
+    async def get_book_details_async(
+        self, asin: str, locale: str = "com"
+    ) -> Optional[Dict]:
+        """Get detailed book information from Audible, served from the cache when fresh"""
+        cache_key = f"{asin}_{locale}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            data = await self._get_json(
+                f"https://api.audible.{locale}/1.0/catalog/products/{asin}",
+                {"response_groups": _RESPONSE_GROUPS, "image_sizes": "500,1000"},
+            )
+            details = self._parse_book_details(asin, data)
+        except Exception as e:
+            self.logger.exception("Error fetching book details: %s", e)
+            return None
+
+        if details is not None:
+            self._cache_put(cache_key, details)
+        return details
+
+    async def download_cover_async(self, cover_url: str, asin: str) -> Optional[str]:
+        """Download and save cover image, reusing a previously downloaded copy"""
+        if not cover_url or not self.config.get("embed_covers", True):
+            return None
+
+        cached_path = self._cached_cover(asin)
+        if cached_path:
+            return cached_path
+
+        # Books sharing an ASIN wait on the first download instead of starting
+        # their own; the entry is dropped once it finishes
+        task = self._cover_downloads.get(asin)
+        if task is None:
+            task = asyncio.create_task(self._fetch_cover_async(cover_url, asin))
+            self._cover_downloads[asin] = task
+            task.add_done_callback(lambda _: self._cover_downloads.pop(asin, None))
+        # Shielded so one cancelled caller doesn't cancel the others' download
+        return await asyncio.shield(task)
+
+    async def _fetch_cover_async(self, cover_url: str, asin: str) -> Optional[str]:
+        """Download a cover and save it to the covers folder"""
+        try:
+            async with self._cover_slots:
+                async with self.http.get(cover_url) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+
+            cover_path = self._cover_write_dir / f"{asin}.jpg"
+            saved_path = await asyncio.to_thread(
+                self._save_cover_to_path, cover_path, io.BytesIO(content)
+            )
+            if saved_path:
+                self._cover_paths[asin] = saved_path
+            return saved_path
+
+        except Exception as e:
+            self.logger.error("Error downloading cover: %s", e)
+            return None
+
+    async def process_book(self, file_path: Path, asin: Optional[str] = None) -> bool:
+        """Look up, tag and move one ASIN-tagged file. Returns False if it needs the interactive flow"""
+        if asin is None:
+            asin = await asyncio.to_thread(self.extract_asin_from_file, file_path)
+        if not asin:
+            return False
+
+        self.logger.info(f"Auto-processing {file_path.name} with ASIN: {asin}")
+
+        book_data = await self.get_book_details_async(asin, self._locale_order[0])
+        if not book_data:
+            self.logger.error(f"Failed to get book details for ASIN: {asin}")
+            return False
+
+        cover_path = await self.download_cover_async(
+            book_data.get("cover_url"), book_data["asin"]
+        )
+
+        # Tagging and moving are blocking disk work
+        if not await asyncio.to_thread(self.tag_file, file_path, book_data, cover_path):
+            self.logger.error(f"Failed to tag file during auto-processing: {file_path}")
+            return False
+        await asyncio.to_thread(self.move_to_library, file_path, book_data, cover_path)
+
+        self.logger.info(f"Successfully auto-processed: {file_path.name}")
+        return True
+
+    async def process_all(
+        self, file_paths: List[Path], asins: Optional[Dict[Path, str]] = None
+    ) -> Tuple[int, List[Path]]:
+        """Auto-process files concurrently.
+
+        Returns the number of processed files and the files that need the
+        interactive flow, in their original order.
+        """
+        asins = asins or {}
+        outcomes = await asyncio.gather(
+            *(self.process_book(f, asins.get(f)) for f in file_paths),
+            return_exceptions=True,
+        )
+
+        remaining = []
+        for file_path, outcome in zip(file_paths, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(
+                    "Error in auto-processing for %s: %s", file_path, outcome
+                )
+                remaining.append(file_path)
+            elif not outcome:
+                remaining.append(file_path)
+
+        return len(file_paths) - len(remaining), remaining
+
+    async def run_async(self) -> None:
+        """Main execution loop: concurrent auto-processing, then interactive fallback"""
+        started = await asyncio.to_thread(self._start_run)
+        if started is None:
+            return
+        auto_tag, scanned, total = started
+
+        with logging_redirect_tqdm():
+            processed = 0
+            remaining = [file_path for file_path, _, _ in scanned]
+            if auto_tag:
+                asins = {file_path: asin for file_path, asin, _ in scanned if asin}
+                processed, failed = await self.process_all(list(asins), asins)
+                # Keep the interactive fallback in the original scan order
+                failed = set(failed)
+                remaining = [f for f in remaining if f not in asins or f in failed]
+
+            # Prompts block anyway, so the interactive flow runs as-is
+            processed += self._process_batch_interactive(remaining)
+
+        self._finish_run(processed, total)
+
+
+async def main() -> None:
+    async with AsyncAudibleTagger() as tagger:
+        await tagger.run_async()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,12 +3,30 @@
 Database module for tracking audiobooks and their processing status
 """
 
+import json
 import sqlite3
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+# Search sessions are stored as JSON text; orjson encodes and decodes them faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 class AudiobookDatabase:
     """SQLite database for tracking audiobooks"""
@@ -217,8 +235,6 @@ class AudiobookDatabase:
     ) -> bool:
         """Save search session results"""
         try:
-            import json
-
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
 
@@ -227,7 +243,7 @@ class AudiobookDatabase:
                     INSERT OR REPLACE INTO search_sessions (session_id, file_id, search_results)
                     VALUES (?, ?, ?)
                 """,
-                    (session_id, file_id, json.dumps(search_results)),
+                    (session_id, file_id, _dumps(search_results)),
                 )
 
                 conn.commit()
@@ -243,8 +259,6 @@ class AudiobookDatabase:
     def get_search_session(self, session_id: str) -> Optional[Dict]:
         """Get search session by session_id"""
         try:
-            import json
-
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
@@ -259,7 +273,7 @@ class AudiobookDatabase:
                 row = cursor.fetchone()
                 if row:
                     data = dict(row)
-                    data["search_results"] = json.loads(data["search_results"])
+                    data["search_results"] = _loads(data["search_results"])
                     return data
                 return None
 
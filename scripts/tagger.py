@@ -6,16 +6,64 @@ Automatically tags .m4b files with metadata from Audible's API
 
 import os
 import re
+import atexit
+import errno
+import hashlib
 import json
 import logging
 import shutil
+import struct
+import tempfile
+import threading
+import time
+import weakref
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
+    wait,
+)
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from colorama import init, Fore, Style
 from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 from mutagen.mp4 import MP4, MP4Cover, MP4FreeForm
 
+# Used for reflink clones on cross-mount moves; not available on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson parses Audible's large product payloads several times faster; json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+else:
+    _loads = json.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        text = json.dumps(obj, indent=4 if pretty else None, ensure_ascii=False)
+        return text.encode("utf-8")
+
 # Initialize colorama for cross-platform colored output
 init()
 
@@ -65,17 +113,414 @@ class TagConstants:
     GROUP = "\xa9grp"
 
 
+# Filename patterns for title/author detection, fused into one alternation tried in
+# order of specificity; the last named group tells which format matched
+_NAME_RE = re.compile(
+    r"^(?:"
+    r"(?P<t_by>.+?)\s*by\s*(?P<a_by>.+)$"  # Title by Author
+    r"|(?P<t_ser>.+?)\s*\((?P<s_ser>.+?)\s*#\d+\.?\d*\)$"  # Title (Series #N)
+    r"|(?P<t_par>.+?)\s*\((?P<a_par>.+?)\)$"  # Title (Author)
+    r"|(?P<a_dash>[^-–—]+?)\s*[-–—]\s*(?P<t_dash>.+)$"  # Author - Title
+    r")",
+    re.IGNORECASE,
+)
+
+# Free space a cover directory needs before it is picked at startup
+_MIN_COVER_DIR_FREE = 5 * 1024 * 1024
+
+# Linux ioctl that makes dst share src's extents (Btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+# Spare room reserved in the metadata atoms when a save has to grow them
+_TAG_PADDING_HEADROOM = 256 * 1024
+
+# MP4 atoms that store integers rather than text
+_INT_TAG_KEYS = frozenset({"shwm", "stik", "rtng"})
+
+# MP4 atoms that store a flag; mutagen reads them back as a single bool
+_BOOL_TAG_KEYS = frozenset({TagConstants.GAPLESS_ALT, "cpil", "pcst"})
+
+# Most ASINs the catalog products endpoint accepts in one request
+_BULK_ASIN_LIMIT = 50
+
+# Most cover downloads in flight at once, so batch runs don't exhaust connections
+_COVER_CONCURRENCY = 8
+
+# Audible catalog API response groups needed for tagging
+_RESPONSE_GROUPS = (
+    "category_ladders,contributors,media,product_desc,product_attrs,"
+    "product_extended_attrs,rating,series"
+)
+
+# HTML cleanup for Audible descriptions
+_TAG_RE = re.compile(r"<[^>]+>")
+_ENTITY_MAP = {
+    "&nbsp;": " ",
+    "&amp;": "&",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&quot;": '"',
+    "&#39;": "'",
+    "&apos;": "'",
+    "&ldquo;": '"',
+    "&rdquo;": '"',
+    "&lsquo;": "'",
+    "&rsquo;": "'",
+    "&mdash;": "—",
+    "&ndash;": "–",
+    "&hellip;": "...",
+}
+_ENTITY_RE = re.compile("|".join(map(re.escape, _ENTITY_MAP)))
+
+# Common words dropped from search queries, matched case-insensitively
+_STOPWORDS = frozenset(
+    {"by", "the", "and", "or", "in", "on", "at", "to", "for", "of", "with", "from"}
+)
+# Splits text into alternating word / non-word runs, the same word boundaries as \b
+_WORD_RUNS_RE = re.compile(r"(\W+)")
+
+# Characters that are invalid in file names on common filesystems, plus control characters
+_FS_INVALID = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def clean_filename(name: str) -> str:
+    """Clean filename for filesystem compatibility"""
+    if not name:
+        return "Unknown"
+    # Replace problematic characters, then drop leading/trailing spaces and dots
+    return _FS_INVALID.sub("_", name).strip(" .") or "Unknown"
+
+
+def _iter_m4b(root, onerror=None):
+    """Walk root with os.scandir, yielding the DirEntry of every .m4b file.
+
+    DirEntry caches its type and stat results, so large libraries are walked
+    without a stat call per entry. Like os.walk, directories that cannot be
+    listed are passed to onerror (if given) and skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".m4b") and entry.is_file():
+                        yield entry
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone src to dst with a copy-on-write reflink, keeping timestamps and mode.
+
+    Renames between Btrfs subvolumes or bind mounts fail with EXDEV even though
+    the data can be shared in O(1); returns False (leaving no dst behind) where
+    the platform or filesystem can't clone, so the caller falls back to a copy.
+    """
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except OSError:
+        with suppress(OSError):
+            os.unlink(dst)
+        return False
+
+
+# MP4 atom header: 32-bit big-endian size followed by a 4-byte type
+_ATOM_HEADER = struct.Struct(">I4s")
+_ATOM_EXT_SIZE = struct.Struct(">Q")
+
+# Atom path leading to the udta atom; everything below it is small enough to read at once
+_UDTA_PATH = (b"moov", b"udta")
+
+
+def _iter_atoms(f, start: int, end: int):
+    """Yield (type, payload_start, atom_end) for the atoms between start and end"""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, kind = _ATOM_HEADER.unpack(header)
+        header_size = 8
+        if size == 1:
+            size = _ATOM_EXT_SIZE.unpack(f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size or pos + size > end:
+            raise ValueError(f"Malformed atom {kind!r} at offset {pos}")
+        yield kind, pos + header_size, pos + size
+        pos += size
+
+
+def _iter_buffer_atoms(buf: memoryview, start: int, end: int):
+    """Like _iter_atoms, but over an in-memory buffer without any seek/read calls"""
+    pos = start
+    while pos + 8 <= end:
+        size, kind = _ATOM_HEADER.unpack_from(buf, pos)
+        header_size = 8
+        if size == 1:
+            size = _ATOM_EXT_SIZE.unpack_from(buf, pos + 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size or pos + size > end:
+            raise ValueError(f"Malformed atom {kind!r} at offset {pos}")
+        yield kind, pos + header_size, pos + size
+        pos += size
+
+
+def _find_buffer_atom(buf: memoryview, start: int, end: int, wanted: bytes):
+    """Return (payload_start, atom_end) of the first wanted child atom, or None"""
+    for kind, payload, atom_end in _iter_buffer_atoms(buf, start, end):
+        if kind == wanted:
+            return payload, atom_end
+    return None
+
+
+def _fast_extract_asin(path) -> Optional[str]:
+    """Read the ASIN straight from the ilst atom without parsing the whole file.
+
+    Only the atom headers along moov/udta are read from disk; sample tables
+    and media data are skipped. The udta atom is then loaded in one read and
+    walked in memory. Raises ValueError when the file layout is not understood
+    so callers can fall back to mutagen.
+    """
+    with open(path, "rb") as f:
+        start, end = 0, os.fstat(f.fileno()).st_size
+        for container in _UDTA_PATH:
+            for kind, payload, atom_end in _iter_atoms(f, start, end):
+                if kind == container:
+                    start, end = payload, atom_end
+                    break
+            else:
+                # No user data atom, so no ASIN tag
+                return None
+        f.seek(start)
+        buf = memoryview(f.read(end - start))
+
+    # 'meta' is a full atom with 4 bytes of version/flags before its children
+    found = _find_buffer_atom(buf, 0, len(buf), b"meta")
+    if found is None:
+        return None
+    found = _find_buffer_atom(buf, found[0] + 4, found[1], b"ilst")
+    if found is None:
+        return None
+
+    wanted = {
+        TagConstants.ASIN: None,
+        TagConstants.AUDIBLE_ASIN: None,
+        TagConstants.SIMPLE_ASIN: None,
+        TagConstants.CDEK_ASIN: None,
+    }
+    for kind, payload, atom_end in _iter_buffer_atoms(buf, found[0], found[1]):
+        data = None
+        if kind == b"----":
+            mean = name = b""
+            for child, child_payload, child_end in _iter_buffer_atoms(
+                buf, payload, atom_end
+            ):
+                if child == b"mean":
+                    mean = bytes(buf[child_payload + 4 : child_end])
+                elif child == b"name":
+                    name = bytes(buf[child_payload + 4 : child_end])
+                elif child == b"data" and data is None:
+                    data = (child_payload, child_end)
+            key = f"----:{mean.decode('latin-1')}:{name.decode('latin-1')}"
+        else:
+            key = kind.decode("latin-1")
+            if key in wanted:
+                data = _find_buffer_atom(buf, payload, atom_end, b"data")
+
+        if key in wanted and wanted[key] is None and data is not None:
+            # Skip the 4-byte type indicator and 4-byte locale
+            wanted[key] = bytes(buf[data[0] + 8 : data[1]])
+
+    for value in wanted.values():
+        if value:
+            value = value.strip()
+            if len(value) >= 10:
+                return value.decode("utf-8", errors="replace")
+    return None
+
+
+def _tag_padding(info) -> int:
+    """Padding policy for mutagen saves.
+
+    Existing free space is kept as-is whenever the new tags fit, so the audio
+    data is never shifted. When the tags outgrow it, leave enough headroom for
+    later re-tags (new cover, longer description) to be written in place.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return _TAG_PADDING_HEADROOM
+
+
+def _build_opf_content(metadata: Dict) -> str:
+    """Create OPF content for Audiobookshelf compatibility"""
+    # Extract basic information with proper None handling
+    title = metadata.get("title") or "Unknown Title"
+    author = metadata.get("author") or "Unknown Author"
+    narrator = metadata.get("narrator", "")
+    publisher = metadata.get("publisher_name", "")
+    isbn = metadata.get("isbn", "")
+    description = AudibleTagger.clean_html_text(metadata.get("description", ""))
+    language = metadata.get("language", "en")
+    series = metadata.get("series", "")
+
+    # Extract publish year from release date
+    publish_year = ""
+    if metadata.get("release_date"):
+        try:
+            publish_year = metadata["release_date"][:4]
+        except:
+            pass
+
+    # Ensure we have a proper volume number for series
+    volume_number = metadata.get("series_part", "")
+    if volume_number and volume_number.isdigit():
+        volume_number = str(int(volume_number))  # Remove leading zeros
+
+    # Create genres list
+    genres = metadata.get("genres", [])
+
+    # Build the document as a tree; ElementTree handles escaping. The
+    # prefixed names are written literally to match the declared namespaces.
+    package = ET.Element(
+        "package",
+        {
+            "xmlns": "http://www.idpf.org/2007/opf",
+            "version": "3.0",
+            "unique-identifier": "BookId",
+        },
+    )
+    metadata_el = ET.SubElement(
+        package,
+        "metadata",
+        {
+            "xmlns:dc": "http://purl.org/dc/elements/1.1/",
+            "xmlns:opf": "http://www.idpf.org/2007/opf",
+        },
+    )
+
+    def add(tag: str, text, attrib: Optional[Dict] = None) -> None:
+        ET.SubElement(metadata_el, tag, attrib or {}).text = str(text or "")
+
+    add("dc:identifier", metadata.get("asin", "unknown"), {"id": "BookId"})
+    add("dc:title", title)
+    add("dc:creator", author)
+    add("dc:publisher", publisher)
+    add("dc:language", language)
+    add("dc:description", description)
+
+    # Add individual genre tags
+    for genre in genres or [""]:
+        add("dc:subject", genre)
+
+    add("dc:date", publish_year)
+    add("dc:identifier", metadata.get("asin", ""), {"opf:scheme": "ASIN"})
+
+    # Add ISBN if available
+    if isbn:
+        add("dc:identifier", isbn, {"opf:scheme": "ISBN"})
+
+    # Add narrator if available
+    if narrator:
+        add("dc:contributor", narrator, {"role": "nrt"})
+
+    # Add series information if available
+    if series:
+        add("dc:subject", series, {"opf:authority": "series"})
+        if volume_number:
+            add("meta", volume_number, {"property": "series-part"})
+
+    # Add additional metadata for Audiobookshelf compatibility
+    if metadata.get("runtime_length_min"):
+        add("meta", metadata["runtime_length_min"], {"property": "duration"})
+
+    if metadata.get("rating"):
+        add("meta", metadata["rating"], {"property": "rating"})
+
+    manifest = ET.SubElement(package, "manifest")
+    ET.SubElement(
+        manifest,
+        "item",
+        {"id": "cover", "href": "cover.jpg", "media-type": "image/jpeg"},
+    )
+    spine = ET.SubElement(package, "spine")
+    ET.SubElement(spine, "itemref", {"idref": "cover"})
+
+    ET.indent(package, space="    ")
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(
+        package, encoding="unicode", short_empty_elements=False
+    )
+
+
+# Taggers whose ASIN ledger still needs saving at exit; held weakly so long-lived
+# servers creating taggers don't keep them all alive
+_OPEN_TAGGERS: "weakref.WeakSet[AudibleTagger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _save_open_ledgers() -> None:
+    """Save the ASIN ledger of every tagger that was never closed"""
+    for tagger in list(_OPEN_TAGGERS):
+        tagger.save_asin_ledger()
+
+
 class AudibleTagger:
+    # Baked-in translator keywords
+    TRANSLATOR_KEYWORDS = (
+        "traducteur",
+        "traductrice",
+        "translator",
+        "traductor",
+        "traductora",
+        "übersetzer",
+        "übersetzerin",
+        "traduttore",
+        "traduttrice",
+        "翻訳者",
+        "번역가",
+        "переводчик",
+        "переводчица",
+    )
+    _TRANSLATOR_RE = re.compile(
+        "|".join(map(re.escape, TRANSLATOR_KEYWORDS)), re.IGNORECASE
+    )
+
+    # Custom iTunes tags copied as-is from a metadata field when it is set
+    _CUSTOM_TAG_FIELDS = (
+        (TagConstants.ASIN, "asin"),
+        (TagConstants.LANGUAGE, "language"),
+        (TagConstants.FORMAT, "format_type"),
+        (TagConstants.SUBTITLE, "subtitle"),
+        (TagConstants.RELEASETIME, "release_time"),
+    )
+
     def __init__(self):
+        # Bound up front so every method can log; setup_logging attaches the handlers
+        self.logger = logging.getLogger(__name__)
+
         self.base_dir = Path.cwd()
         self.incoming_dir = self.base_dir / "incoming"
         self.library_dir = self.base_dir / "library"
         self.covers_dir = self.base_dir / "covers"
+        self.cache_dir = self.base_dir / "cache"
 
         # Create necessary directories
         self.incoming_dir.mkdir(exist_ok=True)
         self.library_dir.mkdir(exist_ok=True)
         self.covers_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(exist_ok=True)
 
         # Setup logging first
         self.setup_logging()
@@ -86,16 +531,182 @@ class AudibleTagger:
         # Update logging level based on config
         self.update_logging_level()
 
+        # Search order is fixed for the run since the preferred locale can't change
+        self._locale_order = self._compute_locales(
+            self.config.get("preferred_locale", "com")
+        )
+
         # Audible API headers (simulating a browser)
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Encoding": "gzip, deflate",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
 
+        # Shared HTTP session so Audible API and cover CDN connections are kept alive
+        self.session = self._create_session()
+
+        # Retry-free session for deadline-bound lookups: each urllib3 retry would
+        # get the full remaining timeout again and overrun the caller's budget
+        self._deadline_session = self._create_session(retries=False)
+
+        # Resolve where covers can be written once instead of probing on every save
+        self._cover_write_dir = self._pick_writable_dir(
+            [
+                self.covers_dir,
+                Path("/tmp"),
+                Path(tempfile.gettempdir()),
+                Path.cwd(),
+            ]
+        )
+
+        # Tag builders in the order their tags are layered, bound once per tagger
+        self._tag_builders = (
+            self._build_basic_tags,
+            self._build_custom_tags,
+            self._build_author_tags,
+            self._build_narrator_tags,
+            self._build_series_tags,
+            self._build_description_tags,
+            self._build_genre_tags,
+            self._build_rating_tags,
+            self._build_adult_content_tags,
+            self._build_itunes_tags,
+            self._build_audible_tags,
+            self._build_album_sort_tag,
+            self._build_compatibility_tags,
+        )
+
+        # Cover paths already resolved during this run, keyed by ASIN
+        self._cover_paths: Dict[str, str] = {}
+
+        # Library directories already created during this run
+        self._created_dirs: Set[Path] = set()
+
+        # Cap concurrent cover downloads across batch and single-file tagging
+        self._cover_sem = threading.BoundedSemaphore(_COVER_CONCURRENCY)
+
+        # Per-ASIN [lock, users] so the same cover is never downloaded twice at
+        # once; entries are dropped when their last user is done
+        self._cover_locks: Dict[str, list] = {}
+        self._cover_locks_guard = threading.Lock()
+
+        # On-disk cache of Audible API responses, expired by file age
+        self.api_cache_dir = self.cache_dir / "audible"
+        self.api_cache_dir.mkdir(exist_ok=True)
+        self._cache_ttl = self.config.get("cache_ttl_hours", 168) * 3600
+
+        # Persisted path -> (mtime_ns, size, asin) ledger so unchanged files are not re-read
+        self._asin_ledger_path = self.cache_dir / "asin_ledger.json"
+        self._asin_ledger = self._load_asin_ledger()
+        self._asin_ledger_dirty = False
+        _OPEN_TAGGERS.add(self)
+
+    def _load_asin_ledger(self) -> Dict[str, list]:
+        """Load the persisted ASIN ledger, starting empty if it is missing or corrupt"""
+        try:
+            with open(self._asin_ledger_path, "rb") as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Could not read ASIN ledger: {e}")
+            return {}
+
+    def save_asin_ledger(self) -> None:
+        """Write the ASIN ledger back to disk if it changed"""
+        if not self._asin_ledger_dirty:
+            return
+        try:
+            tmp_path = self._asin_ledger_path.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(self._asin_ledger))
+            os.replace(tmp_path, self._asin_ledger_path)
+            self._asin_ledger_dirty = False
+        except Exception as e:
+            self.logger.warning(f"Could not save ASIN ledger: {e}")
+
+    def close(self) -> None:
+        """Save the ASIN ledger and release the pooled HTTP connections"""
+        self.save_asin_ledger()
+        _OPEN_TAGGERS.discard(self)
+        self.session.close()
+        self._deadline_session.close()
+
+    def __enter__(self) -> "AudibleTagger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _pick_writable_dir(self, candidates: List[Path]) -> Path:
+        """Return the first candidate directory that is writable and has room for covers"""
+        for candidate in candidates:
+            try:
+                candidate.mkdir(parents=True, exist_ok=True)
+                has_room = shutil.disk_usage(candidate).free > _MIN_COVER_DIR_FREE
+            except OSError:
+                continue
+            if has_room and os.access(candidate, os.W_OK):
+                if candidate != candidates[0]:
+                    self.logger.warning(
+                        f"{candidates[0]} is not writable, saving covers to {candidate}"
+                    )
+                return candidate
+        # Nothing usable; keep the primary so errors surface at write time
+        return candidates[0]
+
+    def _cache_get(self, name: str):
+        """Return a cached Audible API payload if it is younger than the TTL"""
+        cache_path = self.api_cache_dir / f"{name}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self._cache_ttl:
+                return None
+            with open(cache_path, "rb") as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+
+    def _cache_put(self, name: str, data) -> None:
+        """Store an Audible API payload in the cache, replacing it atomically"""
+        cache_path = self.api_cache_dir / f"{name}.json"
+        # Lookups run on several threads, so give each writer its own temp file
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write cache entry {cache_path}: {e}")
+
+    def _create_session(self, retries: bool = True) -> requests.Session:
+        """Create a pooled HTTP session, retrying transient errors unless disabled"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=(
+                Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                )
+                if retries
+                else 0
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
     def load_config(self) -> Dict:
         """Load configuration from config.json"""
         config_path = self.base_dir / "config.json"
@@ -115,55 +726,37 @@ class AudibleTagger:
             "add_single_genre_only": False,
             "genre_delimiter": "/",
             "auto_tag_enabled": False,  # New: Enable auto-tagging
-            "make_backup": True,  # New: Enable backup creation
+            "make_backup": False,  # Opt-in: a full copy doubles disk I/O per file
+            "cache_ttl_hours": 168,  # How long cached Audible API responses stay valid
+            "verify_after_tagging": False,  # Re-read each file after tagging
         }
 
         try:
             if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    user_config = json.load(f)
+                with open(config_path, "rb") as f:
+                    user_config = _loads(f.read())
                     # Merge user config with defaults
                     default_config.update(user_config)
-                    if hasattr(self, "logger"):
-                        pass  # Remove config loading logging
             else:
                 # Create default config file
-                with open(config_path, "w", encoding="utf-8") as f:
-                    json.dump(default_config, f, indent=4, ensure_ascii=False)
-                if hasattr(self, "logger"):
-                    pass  # Remove default config creation logging
+                with open(config_path, "wb") as f:
+                    f.write(_dumps(default_config, pretty=True))
 
         except Exception as e:
-            if hasattr(self, "logger"):
-                self.logger.warning(
-                    f"Error loading configuration: {e}. Using defaults."
-                )
+            self.logger.warning(f"Error loading configuration: {e}. Using defaults.")
 
         return default_config
 
-    def clean_html_text(self, html_text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def clean_html_text(html_text: str) -> str:
         """Clean HTML text and format for plain text files"""
         if not html_text:
             return ""
 
-        # Replace common HTML entities
-        html_text = html_text.replace("&nbsp;", " ")
-        html_text = html_text.replace("&amp;", "&")
-        html_text = html_text.replace("&lt;", "<")
-        html_text = html_text.replace("&gt;", ">")
-        html_text = html_text.replace("&quot;", '"')
-        html_text = html_text.replace("&#39;", "'")
-        html_text = html_text.replace("&apos;", "'")
-        html_text = html_text.replace("&ldquo;", '"')
-        html_text = html_text.replace("&rdquo;", '"')
-        html_text = html_text.replace("&lsquo;", "'")
-        html_text = html_text.replace("&rsquo;", "'")
-        html_text = html_text.replace("&mdash;", "—")
-        html_text = html_text.replace("&ndash;", "–")
-        html_text = html_text.replace("&hellip;", "...")
-
-        # Remove HTML tags
-        clean_text = re.sub(r"<[^>]+>", "", html_text)
+        # Replace common HTML entities in one pass, then remove HTML tags
+        html_text = _ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(0)], html_text)
+        clean_text = _TAG_RE.sub("", html_text)
 
         # Split into paragraphs and clean each one
         paragraphs = clean_text.split("\n")
@@ -197,21 +790,21 @@ class AudibleTagger:
             return
 
         try:
+            desc_content = metadata.get("description") or ""
+            opf_content = self.create_opf_content(metadata)
+            reader_content = metadata.get("narrator") or ""
+
             # Create desc.txt (description)
-            if metadata.get("description"):
-                desc_content = metadata["description"]
+            if desc_content:
                 desc_file = dest_dir / "desc.txt"
-                with open(desc_file, "w", encoding="utf-8") as f:
-                    f.write(desc_content)
+                desc_file.write_text(desc_content, encoding="utf-8")
 
             # Create reader.txt (narrator)
-            if metadata.get("narrator"):
+            if reader_content:
                 reader_file = dest_dir / "reader.txt"
-                with open(reader_file, "w", encoding="utf-8") as f:
-                    f.write(metadata["narrator"])
+                reader_file.write_text(reader_content, encoding="utf-8")
 
             # Create OPF file (Open Packaging Format)
-            opf_content = self.create_opf_content(metadata)
             if opf_content:
                 # Use the new processed filename for the .opf file
                 # Get the .m4b file in the destination directory
@@ -226,16 +819,6 @@ class AudibleTagger:
                     series_part = metadata.get("series_part", "")
 
                     # Clean the title for filename
-                    def clean_filename(name: str) -> str:
-                        if not name:
-                            return "Unknown"
-                        cleaned = re.sub(r'[<>:"/\\|?*]', "_", name)
-                        cleaned = cleaned.encode("utf-8", errors="replace").decode(
-                            "utf-8"
-                        )
-                        cleaned = cleaned.strip(" .")
-                        return cleaned if cleaned else "Unknown"
-
                     title_clean = clean_filename(title)
 
                     # Build filename similar to how it's done in move_to_library
@@ -250,14 +833,17 @@ class AudibleTagger:
                         m4b_name = title_clean
 
                 opf_file = dest_dir / f"{m4b_name}.opf"
-                with open(opf_file, "w", encoding="utf-8") as f:
-                    f.write(opf_content)
+                opf_file.write_text(opf_content, encoding="utf-8")
 
             # Copy cover image to book folder if available
             if cover_path and Path(cover_path).exists():
                 cover_dest = dest_dir / "cover.jpg"
                 try:
-                    shutil.copy2(cover_path, cover_dest)
+                    # Hardlink when covers and library share a filesystem; no data copied
+                    try:
+                        os.link(cover_path, cover_dest)
+                    except OSError:
+                        shutil.copy2(cover_path, cover_dest)
                 except Exception as e:
                     self.logger.warning(f"Could not copy cover to book folder: {e}")
 
@@ -267,109 +853,7 @@ class AudibleTagger:
     def create_opf_content(self, metadata: Dict) -> str:
         """Create OPF content for Audiobookshelf compatibility"""
         try:
-            from xml.sax.saxutils import escape
-
-            # Extract basic information with proper None handling
-            title = metadata.get("title") or "Unknown Title"
-            author = metadata.get("author") or "Unknown Author"
-            narrator = metadata.get("narrator", "")
-            publisher = metadata.get("publisher_name", "")
-            isbn = metadata.get("isbn", "")
-            description = self.clean_html_text(metadata.get("description", ""))
-            language = metadata.get("language", "en")
-            series = metadata.get("series", "")
-            series_part = metadata.get("series_part", "")
-
-            # Extract publish year from release date
-            publish_year = ""
-            if metadata.get("release_date"):
-                try:
-                    publish_year = metadata["release_date"][:4]
-                except:
-                    pass
-            
-            # Ensure we have a proper volume number for series
-            volume_number = metadata.get("series_part", "")
-            if volume_number and volume_number.isdigit():
-                volume_number = str(int(volume_number))  # Remove leading zeros
-
-            # Create genres list
-            genres = metadata.get("genres", [])
-
-            # Create OPF content with conditional fields
-            opf_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="BookId">
-    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-        <dc:identifier id="BookId">{metadata.get('asin', 'unknown')}</dc:identifier>
-        <dc:title>{escape(title)}</dc:title>
-        <dc:creator>{escape(author)}</dc:creator>"""
-
-            # Add optional fields only if they have content
-            if publisher:
-                opf_content += (
-                    f"\n        <dc:publisher>{escape(publisher)}</dc:publisher>"
-                )
-            else:
-                opf_content += "\n        <dc:publisher></dc:publisher>"
-
-            opf_content += f"\n        <dc:language>{language}</dc:language>"
-
-            if description:
-                opf_content += (
-                    f"\n        <dc:description>{escape(description)}</dc:description>"
-                )
-            else:
-                opf_content += "\n        <dc:description></dc:description>"
-
-            # Add individual genre tags
-            if genres:
-                for genre in genres:
-                    opf_content += f"\n        <dc:subject>{escape(genre)}</dc:subject>"
-            else:
-                opf_content += "\n        <dc:subject></dc:subject>"
-
-            if publish_year:
-                opf_content += f"\n        <dc:date>{publish_year}</dc:date>"
-            else:
-                opf_content += "\n        <dc:date></dc:date>"
-
-            opf_content += f'\n        <dc:identifier opf:scheme="ASIN">{metadata.get("asin", "")}</dc:identifier>'
-
-            # Add ISBN if available
-            if isbn:
-                opf_content += f'\n        <dc:identifier opf:scheme="ISBN">{escape(isbn)}</dc:identifier>'
-
-            # Add narrator if available
-            if narrator:
-                opf_content += f'\n        <dc:contributor role="nrt">{escape(narrator)}</dc:contributor>'
-
-            # Add series information if available
-            if series:
-                opf_content += f'\n        <dc:subject opf:authority="series">{escape(series)}</dc:subject>'
-                if volume_number:
-                    opf_content += (
-                        f'\n        <meta property="series-part">{volume_number}</meta>'
-                    )
-
-            # Add additional metadata for Audiobookshelf compatibility
-            if metadata.get("runtime_length_min"):
-                opf_content += f'\n        <meta property="duration">{metadata["runtime_length_min"]}</meta>'
-            
-            if metadata.get("rating"):
-                opf_content += f'\n        <meta property="rating">{escape(metadata["rating"])}</meta>'
-
-            # Close OPF content
-            opf_content += """\n    </metadata>
-<manifest>
-    <item id="cover" href="cover.jpg" media-type="image/jpeg"/>
-</manifest>
-<spine>
-    <itemref idref="cover"/>
-</spine>
-</package>"""
-
-            return opf_content
-
+            return _build_opf_content(metadata)
         except Exception as e:
             self.logger.error(f"Error creating OPF content: {e}")
             return ""
@@ -379,52 +863,28 @@ class AudibleTagger:
         if not authors_list:
             return "Unknown Author"
 
-        # Baked-in translator keywords
-        translator_keywords = [
-            "traducteur",
-            "traductrice",
-            "translator",
-            "traductor",
-            "traductora",
-            "übersetzer",
-            "übersetzerin",
-            "traduttore",
-            "traduttrice",
-            "翻訳者",
-            "번역가",
-            "переводчик",
-            "переводчица",
-        ]
-
         # Get author handling configuration
         exclude_translators = self.config.get("exclude_translators", True)
         output_single_author = self.config.get("output_single_author", False)
 
-        # Filter authors
+        # Filter authors, keeping the unfiltered names as a fallback
+        all_authors = []
         filtered_authors = []
         for author in authors_list:
             author_name = author.get("name", "").strip()
             if not author_name:
                 continue
+            all_authors.append(author_name)
 
             # Skip translators if enabled
-            if exclude_translators:
-                is_translator = any(
-                    keyword.lower() in author_name.lower()
-                    for keyword in translator_keywords
-                )
-                if is_translator:
-                    continue
+            if exclude_translators and self._TRANSLATOR_RE.search(author_name):
+                continue
 
             filtered_authors.append(author_name)
 
         # If no authors after filtering, return original list
         if not filtered_authors:
-            filtered_authors = [
-                author.get("name", "").strip()
-                for author in authors_list
-                if author.get("name", "").strip()
-            ]
+            filtered_authors = all_authors
 
         # Return single author or all authors based on configuration
         if output_single_author and filtered_authors:
@@ -453,7 +913,6 @@ class AudibleTagger:
                     logging.FileHandler(log_file),
                 ],
             )
-            self.logger = logging.getLogger(__name__)
             self.logger.info(f"Tagger logging initialized. Log file: {log_file}")
         except PermissionError:
             # Fallback to console logging only
@@ -462,7 +921,6 @@ class AudibleTagger:
                 format="%(asctime)s - %(levelname)s - %(message)s",
                 handlers=[logging.StreamHandler()],
             )
-            self.logger = logging.getLogger(__name__)
             self.logger.warning(
                 f"Permission denied writing to {log_file}, using console logging only"
             )
@@ -473,18 +931,16 @@ class AudibleTagger:
                 format="%(asctime)s - %(levelname)s - %(message)s",
                 handlers=[logging.StreamHandler()],
             )
-            self.logger = logging.getLogger(__name__)
             self.logger.error(
                 f"Error setting up file logging: {e}, using console logging only"
             )
 
     def update_logging_level(self):
         """Update logging level based on config after config is loaded"""
-        if hasattr(self, "config"):
-            log_level_str = self.config.get("log_level", "INFO").upper()
-            log_level = getattr(logging, log_level_str, logging.INFO)
-            logging.getLogger().setLevel(log_level)
-            self.logger.setLevel(log_level)
+        log_level_str = self.config.get("log_level", "INFO").upper()
+        log_level = getattr(logging, log_level_str, logging.INFO)
+        logging.getLogger().setLevel(log_level)
+        self.logger.setLevel(log_level)
 
     def parse_filename(self, filename: str) -> Tuple[str, str]:
         """Parse filename to extract title and author"""
@@ -495,338 +951,601 @@ class AudibleTagger:
         if not name.strip():
             return "Unknown Title", "Unknown Author"
 
-        # Common patterns for author - title format (in order of specificity)
-        patterns = [
-            r"^(.+?)\s*by\s*(.+)$",  # Title by Author (most specific)
-            r"^(.+?)\s*\((.+?)\s*#\d+\.?\d*\)$",  # Title (Serie's name #book number)
-            r"^(.+?)\s*\((.+?)\)$",  # Title (Author)
-            r"^([^-–—]+?)\s*[-–—]\s*(.+)$",  # Author - Title (least specific)
-        ]
-
-        for i, pattern in enumerate(patterns):
-            match = re.match(pattern, name, re.IGNORECASE)
-            if match:
-                if i == 0:  # Title by Author format
-                    return match.group(1).strip(), match.group(2).strip()
-                elif i == 1:  # Title (Serie's name #book number) format
-                    # For series, only return the title, not the series name
-                    return match.group(1).strip(), "Unknown Author"
-                elif i == 2:  # Title (Author) format
-                    return match.group(1).strip(), match.group(2).strip()
-                elif i == 3:  # Author - Title format
-                    return match.group(2).strip(), match.group(1).strip()
-                else:
-                    # Fallback
-                    return match.group(1).strip(), match.group(2).strip()
+        # Single scan over all supported formats
+        match = _NAME_RE.match(name)
+        if match:
+            kind = match.lastgroup
+            if kind == "a_by":  # Title by Author format
+                return match["t_by"].strip(), match["a_by"].strip()
+            elif kind == "s_ser":  # Title (Serie's name #book number) format
+                # For series, only return the title, not the series name
+                return match["t_ser"].strip(), "Unknown Author"
+            elif kind == "a_par":  # Title (Author) format
+                return match["t_par"].strip(), match["a_par"].strip()
+            else:  # Author - Title format
+                return match["t_dash"].strip(), match["a_dash"].strip()
 
         # If no pattern matches, assume the whole name is the title
         return name.strip(), "Unknown Author"
 
-    def search_audible(self, query: str) -> List[Dict]:
-        """Search Audible for books matching the query using the official API"""
+    @staticmethod
+    def _compute_locales(preferred_locale: str) -> List[str]:
+        """Return the baked-in search locales with the preferred locale first"""
+        locales = [
+            "com",
+            "co.uk",
+            "ca",
+            "fr",
+            "de",
+            "it",
+            "es",
+            "co.jp",
+            "com.au",
+            "com.br",
+        ]
+
+        # Put preferred locale first in search order
+        if preferred_locale in locales:
+            locales.remove(preferred_locale)
+        locales.insert(0, preferred_locale)
+        return locales
+
+    def _request_timeout(self, deadline: Optional[float]):
+        """Timeout for one request, shrunk to fit the caller's deadline.
+
+        Requests made against a deadline go through the retry-free session, so
+        this timeout bounds the whole request. Returns None once the deadline
+        has passed.
+        """
+        if deadline is None:
+            return (3.05, 30)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return (min(3.05, remaining), max(0.5, remaining))
+
+    def search_audible(
+        self, query: str, deadline: Optional[float] = None
+    ) -> List[Dict]:
+        """Search Audible for books matching the query using the official API.
+
+        deadline is an optional time.monotonic() value bounding the whole search.
+        """
         try:
-            # Use baked-in search locales with preferred locale first
-            locales = [
-                "com",
-                "co.uk",
-                "ca",
-                "fr",
-                "de",
-                "it",
-                "es",
-                "co.jp",
-                "com.au",
-                "com.br",
-            ]
-            preferred_locale = self.config.get("preferred_locale", "com")
+            locales = self._locale_order
 
-            # Put preferred locale first in search order
-            if preferred_locale in locales:
-                locales.remove(preferred_locale)
-            locales.insert(0, preferred_locale)
+            # Reuse a recent search for the same query
+            cache_key = self._search_cache_key(query)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
             results = []
 
-            for locale in locales:
+            # Query every locale at once; the first one in preference order with
+            # results wins, however long the locales before it take to answer
+            executor = ThreadPoolExecutor(
+                max_workers=len(locales), thread_name_prefix="search"
+            )
+            try:
+                futures = [
+                    executor.submit(self._search_one_locale, locale, query, deadline)
+                    for locale in locales
+                ]
+                budget = 30 if deadline is None else max(0, deadline - time.monotonic())
+
                 try:
-                    # Search API endpoint
-                    search_url = f"https://api.audible.{locale}/1.0/catalog/products"
-                    params = {
-                        "keywords": query,
-                        "response_groups": "category_ladders,contributors,media,product_desc,product_attrs,product_extended_attrs,rating,series",
-                        "image_sizes": "500,1000",
-                        "num_results": "5",
-                    }
-
-                    response = requests.get(
-                        search_url, params=params, headers=self.headers, timeout=10
+                    for _ in as_completed(futures, timeout=budget):
+                        decided = self._preferred_results(
+                            [f.result() if f.done() else None for f in futures]
+                        )
+                        if decided is not None:
+                            results = decided
+                            break
+                except FutureTimeoutError:
+                    self.logger.warning(f"Timed out searching Audible for: {query}")
+                    # Settle for the most preferred locale that did answer with hits
+                    results = next(
+                        (f.result() for f in futures if f.done() and f.result()), []
                     )
-                    response.raise_for_status()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-                    data = response.json()
-                    if "products" in data:
-                        for product in data["products"]:
-                            # Extract basic info
-                            asin = product.get("asin", "")
-                            title = product.get("title", "Unknown Title")
-
-                            # Extract authors using the new processing method
-                            author = self.process_authors(product.get("authors", []))
-
-                            # Extract narrators
-                            narrators = []
-                            if "narrators" in product:
-                                for narrator in product["narrators"]:
-                                    narrators.append(narrator.get("name", ""))
-
-                            narrator = ", ".join(narrators) if narrators else ""
-
-                            # Extract series information
-                            series_info = ""
-                            if "series" in product and product["series"]:
-                                series_list = product["series"]
-                                if series_list:
-                                    series_info = series_list[0].get("title", "")
-                                    if series_list[0].get("sequence"):
-                                        series_info += f" #{series_list[0]['sequence']}"
-
-                            # Check if we already have this ASIN
-                            if not any(r["asin"] == asin for r in results):
-                                results.append(
-                                    {
-                                        "title": title,
-                                        "author": author,
-                                        "narrator": narrator,
-                                        "series": series_info,
-                                        "asin": asin,
-                                        "locale": locale,
-                                    }
-                                )
-
-                        # If we found results, we can stop searching other locales
-                        if results:
-                            break
+            results = results[:5]  # Limit to 5 results
+            if results:
+                self._cache_put(cache_key, results)
+            return results
 
-                except Exception as e:
-                    self.logger.warning(f"Error searching Audible {locale}: {e}")
-                    continue
+        except Exception as e:
+            self.logger.error(f"Error searching Audible: {e}")
+            return []
+
+    @staticmethod
+    def _preferred_results(
+        outcomes: List[Optional[List[Dict]]],
+    ) -> Optional[List[Dict]]:
+        """Pick per-locale search results (None while pending) in preference order.
+
+        Returns the first locale's hits once every locale before it came back
+        empty, [] if all are empty, or None while that can't be decided yet.
+        """
+        for outcome in outcomes:
+            if outcome is None:
+                return None
+            if outcome:
+                return outcome
+        return []
+
+    def _search_cache_key(self, query: str) -> str:
+        """Cache entry name for a search, scoped to the preferred locale"""
+        query_key = f"{query}\0{self._locale_order[0]}".encode("utf-8")
+        return f"search_{hashlib.sha1(query_key).hexdigest()}"
+
+    def _search_one_locale(
+        self, locale: str, query: str, deadline: Optional[float] = None
+    ) -> List[Dict]:
+        """Search a single Audible locale, returning an empty list on errors"""
+        results = []
+        timeout = self._request_timeout(deadline)
+        if timeout is None:
+            self.logger.debug(f"Time budget exhausted before searching {locale}")
+            return results
+
+        try:
+            # Search API endpoint
+            search_url = f"https://api.audible.{locale}/1.0/catalog/products"
+            params = {
+                "keywords": query,
+                "response_groups": _RESPONSE_GROUPS,
+                "image_sizes": "500,1000",
+                "num_results": "5",
+            }
 
-            return results[:5]  # Limit to 5 results
+            session = self.session if deadline is None else self._deadline_session
+            response = session.get(search_url, params=params, timeout=timeout)
+            response.raise_for_status()
+
+            # Parse the raw bytes directly, skipping requests' charset detection
+            data = _loads(response.content)
+            results = self._parse_search_results(locale, data)
 
         except Exception as e:
-            self.logger.error(f"Error searching Audible: {e}")
+            self.logger.warning(f"Error searching Audible {locale}: {e}")
             return []
 
-    def get_book_details(self, asin: str, locale: str = "com") -> Optional[Dict]:
+        return results
+
+    def _parse_search_results(self, locale: str, data: Dict) -> List[Dict]:
+        """Turn a catalog search response into the search result summaries"""
+        results = []
+        if "products" in data:
+            for product in data["products"]:
+                # Extract basic info
+                asin = product.get("asin", "")
+                title = product.get("title", "Unknown Title")
+
+                # Extract authors using the new processing method
+                author = self.process_authors(product.get("authors", []))
+
+                # Extract narrators
+                narrators = []
+                if "narrators" in product:
+                    for narrator in product["narrators"]:
+                        narrators.append(narrator.get("name", ""))
+
+                narrator = ", ".join(narrators) if narrators else ""
+
+                # Extract series information
+                series_info = ""
+                if "series" in product and product["series"]:
+                    series_list = product["series"]
+                    if series_list:
+                        series_info = series_list[0].get("title", "")
+                        if series_list[0].get("sequence"):
+                            series_info += f" #{series_list[0]['sequence']}"
+
+                # Check if we already have this ASIN
+                if not any(r["asin"] == asin for r in results):
+                    results.append(
+                        {
+                            "title": title,
+                            "author": author,
+                            "narrator": narrator,
+                            "series": series_info,
+                            "asin": asin,
+                            "locale": locale,
+                        }
+                    )
+
+        return results
+
+    def get_book_details(
+        self, asin: str, locale: str = "com", deadline: Optional[float] = None
+    ) -> Optional[Dict]:
         """Get detailed book information from Audible using the official API"""
         try:
+            # Book metadata rarely changes, so serve it from the cache while fresh
+            cache_key = f"{asin}_{locale}"
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
             # Use the official Audible API
             url = f"https://api.audible.{locale}/1.0/catalog/products/{asin}"
             params = {
-                "response_groups": "category_ladders,contributors,media,product_desc,product_attrs,product_extended_attrs,rating,series",
+                "response_groups": _RESPONSE_GROUPS,
                 "image_sizes": "500,1000",
             }
 
-            response = requests.get(
-                url, params=params, headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
+            timeout = self._request_timeout(deadline)
+            if timeout is None:
+                self.logger.debug("Time budget exhausted before fetching %s", asin)
+                return None
 
-            data = response.json()
-            self.logger.info(f"API Response keys: {list(data.keys())}")
+            session = self.session if deadline is None else self._deadline_session
+            response = session.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
 
-            if "product" not in data:
-                self.logger.error(
-                    f"No 'product' key in API response. Available keys: {list(data.keys())}"
-                )
+            # Parse the raw bytes directly, skipping requests' charset detection
+            data = _loads(response.content)
+            details = self._parse_book_details(asin, data)
+            if details is None:
                 return None
 
-            product = data["product"]
-            self.logger.info(f"Product keys: {list(product.keys())}")
-
-            # Extract comprehensive metadata based on Mp3tag reference
-            details = {
-                "asin": asin,
-                "title": product.get("title", ""),
-                "subtitle": product.get("subtitle", ""),
-                "author": "",
-                "authors": [],
-                "narrator": "",
-                "narrators": [],
-                "series": "",
-                "series_part": "",
-                "description": "",
-                "publisher_summary": "",
-                "runtime_length_min": "",
-                "rating": "",
-                "release_date": "",
-                "release_time": "",
-                "language": "",
-                "format_type": "",
-                "publisher_name": "",
-                "is_adult_product": False,
-                "cover_url": "",
-                "genres": [],
-                "copyright": "",
-                "isbn": "",
-                "explicit": False,
-            }
+            self._cache_put(cache_key, details)
+            return details
 
-            # Extract authors using the new processing method
-            if "authors" in product:
-                details["authors"] = [
-                    author.get("name", "")
-                    for author in product["authors"]
-                    if author.get("name")
-                ]
-                details["author"] = self.process_authors(product["authors"])
-
-            # Extract narrators
-            if "narrators" in product:
-                for narrator in product["narrators"]:
-                    details["narrators"].append(narrator.get("name", ""))
-                details["narrator"] = ", ".join(details["narrators"])
-
-            # Extract series information
-            if "series" in product:
-                series_list = product["series"]
-                if series_list:
-                    series_info = series_list[0]  # Take the first series
-                    details["series"] = series_info.get("title", "")
-                    details["series_part"] = str(series_info.get("sequence", ""))
-
-            # Extract description/summary
-            if "publisher_summary" in product:
-                clean_summary = self.clean_html_text(product["publisher_summary"])
-                details["publisher_summary"] = clean_summary
-                details["description"] = clean_summary
-                self.logger.info(
-                    f"Found description: {product['publisher_summary'][:100]}..."
-                )
+        except Exception as e:
+            self.logger.exception("Error fetching book details: %s", e)
+            return None
+
+    def get_many_book_details(
+        self, asins: List[str], locale: str = "com"
+    ) -> Dict[str, Dict]:
+        """Get details for several books, asking the catalog for up to 50 ASINs per request.
+
+        Returns a mapping of ASIN to details; books that could not be fetched
+        are left out. ASINs missing from a bulk response are retried one by one.
+        """
+        found: Dict[str, Dict] = {}
+        missing = []
+        for asin in dict.fromkeys(asins):
+            cached = self._cache_get(f"{asin}_{locale}")
+            if cached is not None:
+                found[asin] = cached
             else:
-                self.logger.warning(
-                    f"No publisher_summary found in product data. Available keys: {list(product.keys())}"
-                )
-                # Try alternative description fields
-                if "merchandising_summary" in product:
-                    details["publisher_summary"] = product["merchandising_summary"]
-                    details["description"] = product["merchandising_summary"]
-                    self.logger.info(f"Using merchandising_summary as description")
-                elif "product_desc" in product:
-                    details["publisher_summary"] = product["product_desc"]
-                    details["description"] = product["product_desc"]
-                    self.logger.info(f"Using product_desc as description")
-                else:
-                    # Final fallback - use empty string
-                    details["publisher_summary"] = ""
-                    details["description"] = ""
-                    self.logger.warning(f"No description found, using empty string")
-
-            # Extract runtime
-            if "runtime_length_min" in product:
-                details["runtime_length_min"] = str(product["runtime_length_min"])
-
-            # Extract rating
-            if "rating" in product:
-                rating = product["rating"]
-                if "overall_distribution" in rating:
-                    overall = rating["overall_distribution"]
-                    details["rating"] = overall.get("display_average_rating", "")
-
-            # Extract release date
-            if "publication_datetime" in product:
-                details["release_date"] = product["publication_datetime"]
-                # Also extract just the date part for RELEASETIME
-                try:
-                    from datetime import datetime
+                missing.append(asin)
 
-                    dt = datetime.fromisoformat(
-                        product["publication_datetime"].replace("Z", "+00:00")
-                    )
-                    details["release_time"] = dt.strftime("%Y-%m-%d")
-                except:
-                    details["release_time"] = (
-                        product["publication_datetime"][:10]
-                        if len(product["publication_datetime"]) >= 10
-                        else ""
-                    )
+        url = f"https://api.audible.{locale}/1.0/catalog/products"
+        for start in range(0, len(missing), _BULK_ASIN_LIMIT):
+            batch = missing[start : start + _BULK_ASIN_LIMIT]
+            params = {
+                "asins": ",".join(batch),
+                "response_groups": _RESPONSE_GROUPS,
+                "image_sizes": "500,1000",
+            }
+            try:
+                response = self.session.get(url, params=params, timeout=(3.05, 30))
+                response.raise_for_status()
+                products = _loads(response.content).get("products") or []
+            except Exception as e:
+                self.logger.warning(f"Bulk lookup failed for {len(batch)} ASINs: {e}")
+                continue
 
-            # Extract language
-            details["language"] = product.get("language", "")
+            for product in products:
+                asin = product.get("asin")
+                if asin not in batch or asin in found:
+                    continue
+                details = self._parse_book_details(asin, {"product": product})
+                if details is not None:
+                    self._cache_put(f"{asin}_{locale}", details)
+                    found[asin] = details
+
+        # Anything the bulk endpoint didn't return gets a regular lookup
+        for asin in missing:
+            if asin not in found:
+                details = self.get_book_details(asin, locale)
+                if details is not None:
+                    found[asin] = details
+
+        return found
+
+    def _parse_book_details(self, asin: str, data: Dict) -> Optional[Dict]:
+        """Extract tagging metadata from a catalog product response"""
+        # Key listings are only built when INFO logging is actually enabled
+        log_keys = self.logger.isEnabledFor(logging.INFO)
+        if log_keys:
+            self.logger.info("API Response keys: %s", list(data.keys()))
+
+        if "product" not in data:
+            self.logger.error(
+                "No 'product' key in API response. Available keys: %s",
+                list(data.keys()),
+            )
+            return None
 
-            # Extract format type
-            details["format_type"] = product.get("format_type", "")
+        product = data["product"]
+        if log_keys:
+            self.logger.info("Product keys: %s", list(product.keys()))
+
+        # Extract comprehensive metadata based on Mp3tag reference
+        details = {
+            "asin": asin,
+            "title": product.get("title", ""),
+            "subtitle": product.get("subtitle", ""),
+            "author": "",
+            "authors": [],
+            "narrator": "",
+            "narrators": [],
+            "series": "",
+            "series_part": "",
+            "description": "",
+            "publisher_summary": "",
+            "runtime_length_min": "",
+            "rating": "",
+            "release_date": "",
+            "release_time": "",
+            "language": "",
+            "format_type": "",
+            "publisher_name": "",
+            "is_adult_product": False,
+            "cover_url": "",
+            "genres": [],
+            "copyright": "",
+            "isbn": "",
+            "explicit": False,
+        }
 
-            # Extract publisher
-            details["publisher_name"] = product.get("publisher_name", "")
+        # Extract authors using the new processing method
+        if "authors" in product:
+            details["authors"] = [
+                author.get("name", "")
+                for author in product["authors"]
+                if author.get("name")
+            ]
+            details["author"] = self.process_authors(product["authors"])
+
+        # Extract narrators
+        if "narrators" in product:
+            for narrator in product["narrators"]:
+                details["narrators"].append(narrator.get("name", ""))
+            details["narrator"] = ", ".join(details["narrators"])
+
+        # Extract series information
+        if "series" in product:
+            series_list = product["series"]
+            if series_list:
+                series_info = series_list[0]  # Take the first series
+                details["series"] = series_info.get("title", "")
+                details["series_part"] = str(series_info.get("sequence", ""))
+
+        # Extract description/summary
+        if "publisher_summary" in product:
+            clean_summary = self.clean_html_text(product["publisher_summary"])
+            details["publisher_summary"] = clean_summary
+            details["description"] = clean_summary
+            self.logger.info(
+                "Found description: %s...", product["publisher_summary"][:100]
+            )
+        else:
+            self.logger.warning(
+                "No publisher_summary found in product data. Available keys: %s",
+                list(product.keys()),
+            )
+            # Try alternative description fields
+            if "merchandising_summary" in product:
+                details["publisher_summary"] = product["merchandising_summary"]
+                details["description"] = product["merchandising_summary"]
+                self.logger.info("Using merchandising_summary as description")
+            elif "product_desc" in product:
+                details["publisher_summary"] = product["product_desc"]
+                details["description"] = product["product_desc"]
+                self.logger.info("Using product_desc as description")
+            else:
+                # Final fallback - use empty string
+                details["publisher_summary"] = ""
+                details["description"] = ""
+                self.logger.warning("No description found, using empty string")
+
+        # Extract runtime
+        if "runtime_length_min" in product:
+            details["runtime_length_min"] = str(product["runtime_length_min"])
+
+        # Extract rating
+        if "rating" in product:
+            rating = product["rating"]
+            if "overall_distribution" in rating:
+                overall = rating["overall_distribution"]
+                details["rating"] = overall.get("display_average_rating", "")
+
+        # Extract release date
+        if "publication_datetime" in product:
+            details["release_date"] = product["publication_datetime"]
+            # Also extract just the date part for RELEASETIME
+            try:
+                from datetime import datetime
 
-            # Extract adult content flag
-            details["is_adult_product"] = product.get("is_adult_product", False)
-            details["explicit"] = product.get("is_adult_product", False)
+                dt = datetime.fromisoformat(
+                    product["publication_datetime"].replace("Z", "+00:00")
+                )
+                details["release_time"] = dt.strftime("%Y-%m-%d")
+            except:
+                details["release_time"] = (
+                    product["publication_datetime"][:10]
+                    if len(product["publication_datetime"]) >= 10
+                    else ""
+                )
 
-            # Extract cover image
-            if "product_images" in product:
-                images = product["product_images"]
-                details["cover_url"] = images.get("1000", images.get("500", ""))
+        # Extract language
+        details["language"] = product.get("language", "")
 
-            # Extract genres from category ladders
-            if "category_ladders" in product:
-                for ladder in product["category_ladders"]:
-                    if ladder.get("root") == "Genres":
-                        for category in ladder.get("ladder", []):
-                            details["genres"].append(category.get("name", ""))
+        # Extract format type
+        details["format_type"] = product.get("format_type", "")
 
-            # Extract copyright and ISBN from extended attributes
-            if "product_extended_attrs" in product:
-                ext_attrs = product["product_extended_attrs"]
-                details["copyright"] = ext_attrs.get("copyright", "")
-                # Try to extract ISBN from various possible fields
-                details["isbn"] = ext_attrs.get("isbn", "") or ext_attrs.get("isbn13", "") or ext_attrs.get("isbn10", "")
+        # Extract publisher
+        details["publisher_name"] = product.get("publisher_name", "")
 
-            return details
+        # Extract adult content flag
+        details["is_adult_product"] = product.get("is_adult_product", False)
+        details["explicit"] = product.get("is_adult_product", False)
 
-        except Exception as e:
-            self.logger.error(f"Error fetching book details: {e}")
-            import traceback
+        # Extract cover image
+        if "product_images" in product:
+            images = product["product_images"]
+            details["cover_url"] = images.get("1000", images.get("500", ""))
 
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
-            return None
+        # Extract genres from category ladders
+        if "category_ladders" in product:
+            for ladder in product["category_ladders"]:
+                if ladder.get("root") == "Genres":
+                    for category in ladder.get("ladder", []):
+                        details["genres"].append(category.get("name", ""))
+
+        # Extract copyright and ISBN from extended attributes
+        if "product_extended_attrs" in product:
+            ext_attrs = product["product_extended_attrs"]
+            details["copyright"] = ext_attrs.get("copyright", "")
+            # Try to extract ISBN from various possible fields
+            details["isbn"] = ext_attrs.get("isbn", "") or ext_attrs.get("isbn13", "") or ext_attrs.get("isbn10", "")
+
+        return details
 
     def download_cover(self, cover_url: str, asin: str) -> Optional[str]:
-        """Download and save cover image"""
+        """Download and save cover image, reusing a previously downloaded copy"""
         try:
             if not cover_url or not self.config.get("embed_covers", True):
                 return None
 
-            response = requests.get(cover_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            cached_path = self._cached_cover(asin)
+            if cached_path:
+                return cached_path
 
-            # Save cover to covers directory
-            cover_path = self.covers_dir / f"{asin}.jpg"
-            return self._save_cover_to_path(cover_path, response.content)
+            # One download per ASIN: concurrent callers for the same book wait for
+            # the first one and then pick its cover up from the cache
+            with self._cover_lock(asin):
+                cached_path = self._cached_cover(asin)
+                if cached_path:
+                    return cached_path
+
+                cover_path = self._cover_write_dir / f"{asin}.jpg"
+
+                # Stream the image straight to disk instead of buffering it; cache
+                # hits above never take a download slot
+                with self._cover_sem, self.session.get(
+                    cover_url, timeout=(3.05, 30), stream=True
+                ) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    saved_path = self._save_cover_to_path(cover_path, response.raw)
+
+                if saved_path:
+                    self._cover_paths[asin] = saved_path
+                return saved_path
 
         except Exception as e:
-            self.logger.error(f"Error downloading cover: {e}")
+            self.logger.error("Error downloading cover: %s", e)
             return None
 
-    def _save_cover_to_path(self, cover_path: Path, content: bytes) -> Optional[str]:
-        """Helper method to save cover content to a specific path"""
+    @contextmanager
+    def _cover_lock(self, asin: str):
+        """Hold the download lock for asin, forgetting it once no thread needs it"""
+        with self._cover_locks_guard:
+            entry = self._cover_locks.get(asin)
+            if entry is None:
+                entry = self._cover_locks[asin] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._cover_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._cover_locks[asin]
+
+    def _cached_cover(self, asin: str) -> Optional[str]:
+        """Return the cover already fetched for asin, in this run or a previous one"""
+        # Covers already fetched during this run
+        if asin in self._cover_paths:
+            return self._cover_paths[asin]
+
+        # Covers left on disk by a previous run
+        cover_path = self._cover_write_dir / f"{asin}.jpg"
         try:
-            # Ensure parent directory exists
-            cover_path.parent.mkdir(exist_ok=True, parents=True)
+            if cover_path.stat().st_size > 0:
+                self._cover_paths[asin] = str(cover_path)
+                return str(cover_path)
+        except FileNotFoundError:
+            pass
+        return None
 
-            # Try to write the file
-            with open(cover_path, "wb") as f:
-                f.write(content)
+    def download_covers(self, items: List[Tuple[str, str]]) -> Dict[str, str]:
+        """Download covers for several (cover_url, asin) pairs concurrently.
+
+        Returns a mapping of ASIN to the saved cover path; failed downloads are
+        left out.
+        """
+        cover_paths: Dict[str, str] = {}
+        if not items:
+            return cover_paths
+
+        with ThreadPoolExecutor(
+            max_workers=_COVER_CONCURRENCY, thread_name_prefix="cover"
+        ) as executor:
+            future_to_asin = {
+                executor.submit(self.download_cover, url, asin): asin
+                for url, asin in items
+            }
+            with tqdm(
+                total=len(future_to_asin),
+                desc="Downloading covers",
+                mininterval=0.5,
+                dynamic_ncols=True,
+            ) as progress:
+                for future in as_completed(future_to_asin):
+                    cover_path = future.result()
+                    if cover_path:
+                        cover_paths[future_to_asin[future]] = cover_path
+                    progress.update(1)
+
+        return cover_paths
+
+    def _save_cover_to_path(self, cover_path: Path, stream) -> Optional[str]:
+        """Helper method to save a cover stream to a specific path.
+
+        Returns None when the disk is full or not writable so tagging can
+        continue without a cover; other errors are raised.
+        """
+        # Write to a private temp file and rename it into place, so a concurrent
+        # reader or an interrupted download never sees a truncated cover
+        tmp_path = cover_path.with_name(
+            f"{cover_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            # The cover directory was created when it was picked at startup
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(stream, f, length=1 << 16)
+                written = f.tell()
 
             # Verify the file was written successfully
-            if cover_path.exists() and cover_path.stat().st_size > 0:
-                return str(cover_path)
-            else:
-                raise Exception("File was not written successfully")
+            if written <= 0:
+                raise ValueError("File was not written successfully")
+
+            os.replace(tmp_path, cover_path)
+            return str(cover_path)
+
+        except OSError as e:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            if e.errno in (errno.ENOSPC, errno.EACCES):
+                self.logger.warning("Cannot save cover to %s: %s", cover_path, e)
+                return None
+            raise
 
         except Exception as e:
-            self.logger.debug(f"Failed to save to {cover_path}: {e}")
+            self.logger.debug("Failed to save to %s: %s", cover_path, e)
+            with suppress(OSError):
+                os.unlink(tmp_path)
             raise
 
     def tag_file(
@@ -835,14 +1554,16 @@ class AudibleTagger:
         """Tag the .m4b file with comprehensive metadata using mutagen"""
         backup_path = None
         try:
-            # Check file permissions first
+            # Check file permissions first; batch runs already filtered these out,
+            # but the API server and auto-processing call in directly
             if not os.access(file_path, os.W_OK):
                 self.logger.error(f"File is not writable: {file_path}")
                 return False
 
-            # Create a backup before tagging (if enabled in config)
-            backup_path = None
-            if self.config.get("make_backup", True):
+            # Create a backup before tagging (if enabled in config). mutagen edits the
+            # file in place, so this has to be a real copy; a hardlink would share
+            # the modified data
+            if self.config.get("make_backup", False):
                 backup_path = file_path.with_suffix(".m4b.backup")
                 try:
                     shutil.copy2(file_path, backup_path)
@@ -850,13 +1571,21 @@ class AudibleTagger:
                 except Exception as e:
                     self.logger.warning(f"Could not create backup: {e}")
                     backup_path = None
-            else:
-                self.logger.info(f"Backup creation disabled for: {file_path.name}")
 
             # Tag with mutagen
             success = self.tag_with_mutagen(file_path, metadata, cover_path)
 
-            # Remove backup if tagging was successful
+            # Optional in-process check; mutagen's save already raises on a failed write
+            if success and self.config.get("verify_after_tagging", False):
+                self.verify_mutagen_tags(
+                    file_path,
+                    metadata,
+                    expect_cover=bool(
+                        cover_path and self.config.get("embed_covers", True)
+                    ),
+                )
+
+            # Remove backup if tagging was successful, otherwise put it back
             if success and backup_path and backup_path.exists():
                 try:
                     backup_path.unlink()
@@ -864,21 +1593,27 @@ class AudibleTagger:
                     self.logger.warning(
                         f"Could not remove backup file {backup_path}: {e}"
                     )
+            elif backup_path:
+                self._restore_backup(backup_path, file_path)
 
             return success
 
         except Exception as e:
             self.logger.error(f"Error tagging file {file_path}: {e}")
-            # Remove backup on error as well
-            if backup_path and backup_path.exists():
-                try:
-                    backup_path.unlink()
-                except Exception as backup_error:
-                    self.logger.warning(
-                        f"Could not remove backup file {backup_path}: {backup_error}"
-                    )
+            # Restore the untouched copy on error as well
+            if backup_path:
+                self._restore_backup(backup_path, file_path)
             return False
 
+    def _restore_backup(self, backup_path: Path, file_path: Path) -> None:
+        """Atomically put a pre-tag backup back over a file whose tagging failed"""
+        try:
+            # A single rename, so file_path never goes missing or half-written
+            os.replace(backup_path, file_path)
+            self.logger.info(f"Restored {file_path.name} from backup")
+        except OSError as e:
+            self.logger.warning(f"Could not restore backup file {backup_path}: {e}")
+
     def _build_basic_tags(self, metadata: Dict) -> Dict:
         """Build basic metadata tags"""
         tags = {}
@@ -899,26 +1634,11 @@ class AudibleTagger:
 
     def _build_custom_tags(self, metadata: Dict) -> Dict:
         """Build custom iTunes tags"""
-        tags = {}
-
-        if metadata.get("asin"):
-            tags[TagConstants.ASIN] = self._ensure_string(metadata["asin"])
-
-        if metadata.get("language"):
-            tags[TagConstants.LANGUAGE] = self._ensure_string(metadata["language"])
-
-        if metadata.get("format_type"):
-            tags[TagConstants.FORMAT] = self._ensure_string(metadata["format_type"])
-
-        if metadata.get("subtitle"):
-            tags[TagConstants.SUBTITLE] = self._ensure_string(metadata["subtitle"])
-
-        if metadata.get("release_time"):
-            tags[TagConstants.RELEASETIME] = self._ensure_string(
-                metadata["release_time"]
-            )
-
-        return tags
+        return {
+            key: self._ensure_string(metadata[field])
+            for key, field in self._CUSTOM_TAG_FIELDS
+            if metadata.get(field)
+        }
 
     def _build_author_tags(self, metadata: Dict) -> Dict:
         """Build author and artist related tags"""
@@ -1037,21 +1757,15 @@ class AudibleTagger:
 
     def _build_description_tags(self, metadata: Dict) -> Dict:
         """Build description and comment tags"""
-        tags = {}
-
         cleaned_description = metadata.get("description", "")
-        if cleaned_description:
-            tags[TagConstants.COMMENT] = (
-                cleaned_description  # COMMENT (Publisher's Summary for MP3)
-            )
-            tags[TagConstants.DESC_ALT] = (
-                cleaned_description  # Alternative description tag
-            )
-            tags[TagConstants.DESC_ALT2] = (
-                cleaned_description  # Alternative description tag
-            )
+        if not cleaned_description:
+            return {}
 
-        return tags
+        # COMMENT (Publisher's Summary for MP3) plus the two alternative description tags
+        return dict.fromkeys(
+            (TagConstants.COMMENT, TagConstants.DESC_ALT, TagConstants.DESC_ALT2),
+            cleaned_description,
+        )
 
     def _build_genre_tags(self, metadata: Dict) -> Dict:
         """Build genre related tags"""
@@ -1098,8 +1812,8 @@ class AudibleTagger:
 
         return tags
 
-    def _build_itunes_tags(self) -> Dict:
-        """Build iTunes specific tags"""
+    def _build_itunes_tags(self, metadata: Optional[Dict] = None) -> Dict:
+        """Build iTunes specific tags (the same for every book)"""
         tags = {}
 
         tags[TagConstants.GAPLESS_ALT] = "True"  # Alternative gapless tag
@@ -1117,12 +1831,18 @@ class AudibleTagger:
             tags[TagConstants.WWWAUDIOFILE] = (
                 audible_url  # WWWAUDIOFILE (Audible Album URL)
             )
-            tags[TagConstants.ASIN] = metadata[
-                "asin"
-            ]  # ASIN (Amazon Standard Identification Number)
-            tags[TagConstants.AUDIBLE_ASIN] = metadata["asin"]  # Additional ASIN tag
-            tags[TagConstants.SIMPLE_ASIN] = metadata["asin"]  # Simple ASIN tag
-            tags[TagConstants.CDEK_ASIN] = metadata["asin"]  # Alternative ASIN tag
+            # ASIN (Amazon Standard Identification Number) under all its tag names
+            tags.update(
+                dict.fromkeys(
+                    (
+                        TagConstants.ASIN,
+                        TagConstants.AUDIBLE_ASIN,
+                        TagConstants.SIMPLE_ASIN,
+                        TagConstants.CDEK_ASIN,
+                    ),
+                    metadata["asin"],
+                )
+            )
 
         return tags
 
@@ -1212,44 +1932,39 @@ class AudibleTagger:
 
             # Load the M4B file
             audio = MP4(file_path)
+            if audio.tags is None:
+                # No metadata atoms yet (untagged encoder output)
+                audio.add_tags()
             # Build comprehensive metadata dictionary using helper methods
             tags = {}
 
-            # Build all tag categories
-            tags.update(self._build_basic_tags(metadata))
-            tags.update(self._build_custom_tags(metadata))
-            tags.update(self._build_author_tags(metadata))
-            tags.update(self._build_narrator_tags(metadata))
-            tags.update(self._build_series_tags(metadata))
-            tags.update(self._build_description_tags(metadata))
-            tags.update(self._build_genre_tags(metadata))
-            tags.update(self._build_rating_tags(metadata))
-            tags.update(self._build_adult_content_tags(metadata))
-            tags.update(self._build_itunes_tags())
-            tags.update(self._build_audible_tags(metadata))
-            tags.update(self._build_album_sort_tag(metadata))
-            tags.update(self._build_compatibility_tags(metadata))
+            # Build all tag categories, later builders overriding earlier ones
+            for build in self._tag_builders:
+                tags.update(build(metadata))
             tags.update(self._build_missing_audible_api_tags(metadata, tags))
 
             # Debug: Print tags before applying
             self.logger.debug(f"Built tags: {tags}")
 
-            # Apply all tags with proper data types
+            # Apply all tags with proper data types, noting whether anything changed
+            changed = False
             for key, value in tags.items():
                 try:
                     if key.startswith("----:"):
                         # Freeform tags need to be MP4FreeForm objects
-                        audio.tags[key] = [MP4FreeForm(value.encode("utf-8"))]
-                    elif key in [
-                        "shwm",
-                        "stik",
-                        "rtng",
-                    ]:
+                        new_value = [MP4FreeForm(value.encode("utf-8"))]
+                    elif key in _INT_TAG_KEYS:
                         # Integer tags
-                        audio.tags[key] = [int(value)]
+                        new_value = [int(value)]
+                    elif key in _BOOL_TAG_KEYS:
+                        # Flag tags, compared the way mutagen reads them back
+                        new_value = str(value).lower() in ("1", "true")
                     else:
                         # Standard tags can be strings
-                        audio.tags[key] = [value]
+                        new_value = [value]
+                    if audio.tags.get(key) != new_value:
+                        audio.tags[key] = new_value
+                        changed = True
                 except Exception as tag_error:
                     self.logger.error(
                         f"Error applying tag {key} with value {value}: {tag_error}"
@@ -1257,29 +1972,80 @@ class AudibleTagger:
                     # Continue with other tags instead of failing completely
                     continue
 
-            # Add cover art if available
+            # Add cover art if available and not already embedded from a previous run
             if cover_path and self.config.get("embed_covers", True):
                 try:
                     with open(cover_path, "rb") as f:
                         cover_data = f.read()
-                    audio["covr"] = [MP4Cover(cover_data)]
+                    existing = audio.tags.get("covr")
+                    if not existing or bytes(existing[0]) != cover_data:
+                        audio["covr"] = [MP4Cover(cover_data)]
+                        changed = True
                 except Exception as e:
                     self.logger.warning(f"Could not embed cover art: {e}")
 
-            # Save the file
-            audio.save()
+            if not changed:
+                # Re-tagging an already tagged file: leave it untouched
+                self.logger.info(f"Tags already up to date: {file_path.name}")
+                return True
+
+            # Save the file; mutagen rewrites only the metadata atoms when they fit
+            audio.save(padding=_tag_padding)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Error with mutagen tagging: {e}")
-            import traceback
+            self.logger.exception("Error with mutagen tagging: %s", e)
+            return False
 
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
+    def verify_mutagen_tags(
+        self, file_path: Path, metadata: Dict, expect_cover: bool = False
+    ) -> bool:
+        """Re-read a tagged file once and check the core tags and cover art together"""
+        try:
+            audio = MP4(file_path)
+        except Exception as e:
+            self.logger.error(f"Could not re-read {file_path} for verification: {e}")
             return False
 
+        stored = audio.tags or {}
+        expected = self._build_basic_tags(metadata)
+        expected.update(self._build_custom_tags(metadata))
+
+        problems = []
+        for key, value in expected.items():
+            if key not in stored or not stored[key]:
+                problems.append(f"missing {key}")
+                continue
+            actual = stored[key][0]
+            if isinstance(actual, bytes):
+                actual = actual.decode("utf-8", errors="replace")
+            if str(actual) != str(value):
+                problems.append(f"{key} is {actual!r}, expected {value!r}")
+
+        if expect_cover and not stored.get("covr"):
+            problems.append("missing cover art")
+
+        if problems:
+            for problem in problems:
+                self.logger.warning(f"Verification of {file_path.name}: {problem}")
+            tqdm.write(
+                f"{Fore.RED}❌ Tag verification failed for {file_path.name}: "
+                f"{'; '.join(problems)}{Style.RESET_ALL}"
+            )
+            return False
+
+        tqdm.write(
+            f"{Fore.GREEN}✅ Verified {len(expected)} tags"
+            f"{' and cover art' if expect_cover else ''} in {file_path.name}{Style.RESET_ALL}"
+        )
+        return True
+
     def move_to_library(
-        self, file_path: Path, metadata: Dict, cover_path: Optional[str] = None
+        self,
+        file_path: Path,
+        metadata: Dict,
+        cover_path: Optional[str] = None,
     ) -> Path:
         """Move tagged file to organized library structure"""
         try:
@@ -1288,19 +2054,7 @@ class AudibleTagger:
             series = metadata.get("series", "")
             title = metadata.get("title", "Unknown Title")
 
-            # Clean names for filesystem with Unicode handling
-            def clean_filename(name: str) -> str:
-                """Clean filename for filesystem compatibility"""
-                if not name:
-                    return "Unknown"
-                # Remove or replace problematic characters
-                cleaned = re.sub(r'[<>:"/\\|?*]', "_", name)
-                # Handle Unicode characters that might cause issues
-                cleaned = cleaned.encode("utf-8", errors="replace").decode("utf-8")
-                # Remove leading/trailing spaces and dots
-                cleaned = cleaned.strip(" .")
-                return cleaned if cleaned else "Unknown"
-
+            # Clean names for filesystem
             author_clean = clean_filename(author)
             series_clean = clean_filename(series) if series else ""
             title_clean = clean_filename(title)
@@ -1337,13 +2091,15 @@ class AudibleTagger:
                 # For standalone: library/Author/Title/Title.m4b
                 dest_dir = self.library_dir / author_clean / title_clean
 
-            dest_dir.mkdir(parents=True, exist_ok=True)
+            # Books in the same series share a folder tree; only create it once per run
+            if dest_dir not in self._created_dirs:
+                os.makedirs(dest_dir, exist_ok=True)
+                self._created_dirs.add(dest_dir)
             dest_path = dest_dir / filename
 
             # Move file with proper Unicode handling
             try:
-                shutil.move(str(file_path), str(dest_path))
-                # Remove file move logging
+                self._move_file(str(file_path), str(dest_path))
             except UnicodeEncodeError as e:
                 self.logger.error(f"Unicode error moving file: {e}")
                 # Fallback: try with encoded path
@@ -1353,7 +2109,11 @@ class AudibleTagger:
                 encoded_dest = (
                     str(dest_path).encode("utf-8", errors="replace").decode("utf-8")
                 )
-                shutil.move(encoded_src, encoded_dest)
+                self._move_file(encoded_src, encoded_dest)
+
+            # The source path no longer exists, so drop it from the ASIN ledger
+            if self._asin_ledger.pop(str(file_path), None) is not None:
+                self._asin_ledger_dirty = True
 
             # Create additional metadata files for Audiobookshelf compatibility
             self.create_additional_metadata_files(
@@ -1366,52 +2126,59 @@ class AudibleTagger:
             self.logger.error(f"Error moving file to library: {e}")
             return file_path
 
+    def _move_file(self, src: str, dst: str) -> None:
+        """Move a file, using a plain rename when source and destination share a filesystem"""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device move: clone or copy the data, then drop the source
+            if not _reflink(src, dst):
+                shutil.copy2(src, dst)
+            os.unlink(src)
+
     def display_book_info(self, metadata: Dict) -> None:
         """Display comprehensive book information in a formatted way"""
-        print(f"\n{Fore.CYAN}📚 Book Information:{Style.RESET_ALL}")
-        print(
-            f"{Fore.YELLOW}Title:{Style.RESET_ALL} {metadata.get('title', 'Unknown')}"
-        )
+        # Collect the lines and emit them with a single write
+        label = f"{Fore.YELLOW}{{}}:{Style.RESET_ALL} {{}}"
+        lines = [
+            f"\n{Fore.CYAN}📚 Book Information:{Style.RESET_ALL}",
+            label.format("Title", metadata.get("title", "Unknown")),
+        ]
         if metadata.get("subtitle"):
-            print(f"{Fore.YELLOW}Subtitle:{Style.RESET_ALL} {metadata['subtitle']}")
-        print(
-            f"{Fore.YELLOW}Author:{Style.RESET_ALL} {metadata.get('author', 'Unknown')}"
-        )
+            lines.append(label.format("Subtitle", metadata["subtitle"]))
+        lines.append(label.format("Author", metadata.get("author", "Unknown")))
         if metadata.get("narrator"):
-            print(f"{Fore.YELLOW}Narrator:{Style.RESET_ALL} {metadata['narrator']}")
+            lines.append(label.format("Narrator", metadata["narrator"]))
         if metadata.get("series"):
             series_info = metadata["series"]
             if metadata.get("series_part"):
                 series_info += f" #{metadata['series_part']}"
-            print(f"{Fore.YELLOW}Series:{Style.RESET_ALL} {series_info}")
+            lines.append(label.format("Series", series_info))
         if metadata.get("runtime_length_min"):
-            print(
-                f"{Fore.YELLOW}Duration:{Style.RESET_ALL} {metadata['runtime_length_min']} minutes"
+            lines.append(
+                label.format("Duration", f"{metadata['runtime_length_min']} minutes")
             )
         if metadata.get("rating"):
-            print(f"{Fore.YELLOW}Rating:{Style.RESET_ALL} {metadata['rating']}")
+            lines.append(label.format("Rating", metadata["rating"]))
         if metadata.get("language"):
-            print(f"{Fore.YELLOW}Language:{Style.RESET_ALL} {metadata['language']}")
+            lines.append(label.format("Language", metadata["language"]))
         if metadata.get("format_type"):
-            print(f"{Fore.YELLOW}Format:{Style.RESET_ALL} {metadata['format_type']}")
+            lines.append(label.format("Format", metadata["format_type"]))
         if metadata.get("publisher_name"):
-            print(
-                f"{Fore.YELLOW}Publisher:{Style.RESET_ALL} {metadata['publisher_name']}"
-            )
+            lines.append(label.format("Publisher", metadata["publisher_name"]))
         if metadata.get("release_date"):
-            print(
-                f"{Fore.YELLOW}Release Date:{Style.RESET_ALL} {metadata['release_date']}"
-            )
+            lines.append(label.format("Release Date", metadata["release_date"]))
         if metadata.get("genres"):
             delimiter = self.config.get("genre_delimiter", "/")
-            print(
-                f"{Fore.YELLOW}Genres:{Style.RESET_ALL} {delimiter.join(metadata['genres'])}"
-            )
+            lines.append(label.format("Genres", delimiter.join(metadata["genres"])))
         if metadata.get("description"):
-            print(
-                f"{Fore.YELLOW}Description:{Style.RESET_ALL} {metadata['description'][:200]}..."
+            lines.append(
+                label.format("Description", f"{metadata['description'][:200]}...")
             )
-        print()
+        lines.append("")
+        tqdm.write("\n".join(lines))
 
     def _handle_no_search_results(self, search_query: str) -> Optional[List[Dict]]:
         """Handle case when no search results are found - UI logic"""
@@ -1550,13 +2317,8 @@ class AudibleTagger:
         """Core file processing logic without UI dependencies"""
         try:
             # Get detailed book information
-            book_data = self.get_book_details(
-                selected_result["asin"], selected_result.get("locale", "com")
-            )
+            book_data = self._get_selected_details(selected_result)
             if not book_data:
-                self.logger.error(
-                    f"Failed to get book details for ASIN: {selected_result['asin']}"
-                )
                 return False
 
             # Download cover
@@ -1566,6 +2328,30 @@ class AudibleTagger:
                     book_data["cover_url"], book_data["asin"]
                 )
 
+            return self._apply(file_path, book_data, cover_path)
+
+        except Exception as e:
+            self.logger.exception(
+                "Error in core processing for %s: %s", file_path, e
+            )
+            return False
+
+    def _get_selected_details(self, selected_result: Dict) -> Optional[Dict]:
+        """Fetch the full details for a search result the user picked"""
+        book_data = self.get_book_details(
+            selected_result["asin"], selected_result.get("locale", "com")
+        )
+        if not book_data:
+            self.logger.error(
+                f"Failed to get book details for ASIN: {selected_result['asin']}"
+            )
+        return book_data
+
+    def _apply(
+        self, file_path: Path, book_data: Dict, cover_path: Optional[str]
+    ) -> bool:
+        """Tag the file and move it to the library once its details are known"""
+        try:
             # Tag the file
             if self.tag_file(file_path, book_data, cover_path):
                 # Move to library
@@ -1576,67 +2362,77 @@ class AudibleTagger:
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error in core processing for {file_path}: {e}")
-            import traceback
-
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
+            self.logger.exception(
+                "Error in core processing for %s: %s", file_path, e
+            )
             return False
 
-    def process_file(self, file_path: Path) -> bool:
-        """Process a single .m4b file with UI interaction"""
-        try:
-            # Parse filename
-            title, author = self.parse_filename(file_path.name)
+    def _select_book(self, file_path: Path) -> Optional[Dict]:
+        """Interactive half of process_file: search Audible and let the user pick a book"""
+        # Parse filename
+        title, author = self.parse_filename(file_path.name)
 
-            # Build search query - exclude "Unknown Author" from search and clean up common words
-            if author == "Unknown Author":
-                search_query = title.strip()
-            else:
-                # Remove common words like "by" from the search query
-                search_query = f"{title} {author}".strip()
-                # Remove "by" and other common words that might interfere with search
-                search_query = re.sub(
-                    r"\b(by|the|and|or|in|on|at|to|for|of|with|from)\b",
-                    "",
-                    search_query,
-                    flags=re.IGNORECASE,
-                )
-                # Clean up extra whitespace
-                search_query = re.sub(r"\s+", " ", search_query).strip()
+        # Build search query - exclude "Unknown Author" from search and clean up common words
+        if author == "Unknown Author":
+            search_query = title.strip()
+        else:
+            # Remove common words like "by" from the search query
+            search_query = f"{title} {author}".strip()
+            # Remove "by" and other common words that might interfere with search,
+            # keeping punctuation next to them ("Mice,and Men" -> "Mice, Men")
+            search_query = "".join(
+                run
+                for run in _WORD_RUNS_RE.split(search_query)
+                if run.lower() not in _STOPWORDS
+            )
+            # Clean up extra whitespace
+            search_query = " ".join(search_query.split())
 
-            print(f"\n{Fore.GREEN}🔍 Processing: {file_path.name}{Style.RESET_ALL}")
-            print(f"Parsed as: {title} {author}")
-            print(f'Search string: "{search_query}"')
+        tqdm.write(
+            f"\n{Fore.GREEN}🔍 Processing: {file_path.name}{Style.RESET_ALL}\n"
+            f"Parsed as: {title} {author}\n"
+            f'Search string: "{search_query}"'
+        )
 
-            # Search Audible
-            results = self.search_audible(search_query)
+        # Search Audible
+        results = self.search_audible(search_query)
 
-            # Handle no results case
+        # Handle no results case
+        if not results:
+            results = self._handle_no_search_results(search_query)
             if not results:
-                results = self._handle_no_search_results(search_query)
-                if not results:
-                    return False
+                return None
+
+        # Get user selection
+        selected = self._get_user_selection(results)
+        if not selected:
+            return None
+
+        # Display book information
+        self.display_book_info(selected)
+        return selected
 
-            # Get user selection
-            selected = self._get_user_selection(results)
+    def _report_result(self, file_path: Path, success: bool) -> None:
+        """Print the per-file outcome line"""
+        if success:
+            tqdm.write(
+                f"{Fore.GREEN}✅ Successfully processed: {file_path.name}{Style.RESET_ALL}"
+            )
+        else:
+            tqdm.write(
+                f"{Fore.RED}❌ Failed to process: {file_path.name}{Style.RESET_ALL}"
+            )
+
+    def process_file(self, file_path: Path) -> bool:
+        """Process a single .m4b file with UI interaction"""
+        try:
+            selected = self._select_book(file_path)
             if not selected:
                 return False
 
-            # Display book information
-            self.display_book_info(selected)
-
             # Process the file using core logic
             success = self._process_file_core(file_path, selected)
-
-            if success:
-                print(
-                    f"{Fore.GREEN}✅ Successfully processed: {file_path.name}{Style.RESET_ALL}"
-                )
-            else:
-                print(
-                    f"{Fore.RED}❌ Failed to process: {file_path.name}{Style.RESET_ALL}"
-                )
-
+            self._report_result(file_path, success)
             return success
 
         except Exception as e:
@@ -1645,32 +2441,224 @@ class AudibleTagger:
 
     def run(self):
         """Main execution loop"""
+        started = self._start_run()
+        if started is None:
+            return
+        auto_tag, scanned, total = started
+
+        with logging_redirect_tqdm():
+            # The auto-tag flag can't change during a run, so pick the code path once
+            if auto_tag:
+                asins = {file_path: asin for file_path, asin, _ in scanned}
+                processed = self._process_batch_auto(list(asins), asins)
+            else:
+                processed = self._process_batch_interactive(
+                    [file_path for file_path, _, _ in scanned]
+                )
+
+        self._finish_run(processed, total)
+
+    def _start_run(self) -> Optional[Tuple[bool, List[Tuple], int]]:
+        """Scan the incoming folder for a run.
+
+        Returns the auto-tag flag, the scanned files that can be tagged and the
+        number of .m4b files found, or None when there is nothing to process.
+        """
         print(f"{Fore.CYAN}🎧 Audible Audiobook Tagger{Style.RESET_ALL}")
         print(f"Scanning directory: {self.incoming_dir}")
 
-        # Find all .m4b files
-        m4b_files = list(self.incoming_dir.rglob("*.m4b"))
+        # Find all .m4b files, reading ASIN tags in the same pass when auto-tagging
+        auto_tag = self.config.get("auto_tag_enabled", False)
+        scanned = list(self._iter_m4b_with_asin(self.incoming_dir, read_asin=auto_tag))
+        self._prune_asin_ledger(scanned)
 
-        if not m4b_files:
+        if not scanned:
             print(
                 f"{Fore.YELLOW}No .m4b files found in {self.incoming_dir}{Style.RESET_ALL}"
             )
-            return
+            return None
 
-        print(f"{Fore.GREEN}Found {len(m4b_files)} .m4b file(s){Style.RESET_ALL}")
+        print(f"{Fore.GREEN}Found {len(scanned)} .m4b file(s){Style.RESET_ALL}")
+        return auto_tag, self._drop_unwritable(scanned), len(scanned)
 
-        # Process each file
-        processed = 0
-        for file_path in tqdm(m4b_files, desc="Processing files"):
-            if self.process_file_with_auto_fallback(file_path):
-                processed += 1
+    def _prune_asin_ledger(self, scanned: List[Tuple]) -> None:
+        """Forget ledger entries for files that are no longer in the incoming folder"""
+        seen = {str(item[0]) for item in scanned}
+        stale = [key for key in self._asin_ledger if key not in seen]
+        for key in stale:
+            del self._asin_ledger[key]
+        if stale:
+            self._asin_ledger_dirty = True
 
+    def _finish_run(self, processed: int, total: int) -> None:
+        """Print the summary at the end of a run"""
         print(f"\n{Fore.GREEN}🎉 Processing complete!{Style.RESET_ALL}")
-        print(f"Successfully processed: {processed}/{len(m4b_files)} files")
-        print(f"Check the library directory for organized files.")
+        print(f"Successfully processed: {processed}/{total} files")
+        print("Check the library directory for organized files.")
+
+    def _drop_unwritable(self, scanned: List[Tuple]) -> List[Tuple]:
+        """Pre-flight permission check: keep the scanned files that can be tagged in place"""
+        writable = []
+        for item in scanned:
+            if os.access(item[0], os.W_OK):
+                writable.append(item)
+            else:
+                self.logger.error(f"File is not writable: {item[0]}")
+        skipped = len(scanned) - len(writable)
+        if skipped:
+            print(
+                f"{Fore.YELLOW}Skipping {skipped} read-only .m4b file(s){Style.RESET_ALL}"
+            )
+        return writable
+
+    def _process_batch_auto(
+        self, m4b_files: List[Path], asins: Dict[Path, Optional[str]]
+    ) -> int:
+        """Run the auto pipeline, then hand the leftovers to the interactive flow"""
+        processed, remaining = self.process_batch_auto(m4b_files, asins)
+        for file_path in remaining:
+            self.logger.info(
+                f"Auto-processing failed for {file_path.name}, falling back to interactive mode"
+            )
+        return processed + self._process_batch_interactive(remaining)
+
+    def _process_batch_interactive(self, m4b_files: List[Path]) -> int:
+        """Ask the user about every file first, then tag and move them in parallel"""
+        selections: List[Tuple[Path, Dict]] = []
+        # Throttle bar redraws since each file prints its own status
+        progress = tqdm(
+            m4b_files,
+            desc="Selecting books",
+            mininterval=0.5,
+            smoothing=0.1,
+            dynamic_ncols=True,
+        )
+        for file_path in progress:
+            try:
+                selected = self._select_book(file_path)
+            except Exception as e:
+                self.logger.error(f"Error processing file {file_path}: {e}")
+                continue
+            if selected:
+                selections.append((file_path, selected))
+            else:
+                self._report_result(file_path, False)
+
+        if not selections:
+            return 0
+
+        # Fetch the details for every pick in bulk requests, then all covers in
+        # one batch, so N books cost a handful of round trips instead of N
+        locale_asins: Dict[str, List[str]] = {}
+        for _, selected in selections:
+            locale_asins.setdefault(selected.get("locale", "com"), []).append(
+                selected["asin"]
+            )
+        details = {
+            (locale, asin): book_data
+            for locale, asin_list in locale_asins.items()
+            for asin, book_data in self.get_many_book_details(
+                asin_list, locale
+            ).items()
+        }
 
-    def extract_asin_from_file(self, file_path: Path) -> Optional[str]:
+        books: List[Tuple[Path, Dict]] = []
+        for file_path, selected in selections:
+            book_data = details.get(
+                (selected.get("locale", "com"), selected["asin"])
+            )
+            if book_data:
+                books.append((file_path, book_data))
+            else:
+                self.logger.error(
+                    f"Failed to get book details for ASIN: {selected['asin']}"
+                )
+                self._report_result(file_path, False)
+
+        cover_paths = self.download_covers(
+            [
+                (book_data["cover_url"], book_data["asin"])
+                for _, book_data in books
+                if book_data.get("cover_url")
+            ]
+        )
+
+        # Tagging and moves are disk bound, so threads overlap them without
+        # pickling the tagger into worker processes
+        processed = 0
+        workers = max(1, (os.cpu_count() or 1) // 2)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="apply"
+        ) as pool:
+            futures = {
+                pool.submit(
+                    self._apply,
+                    file_path,
+                    book_data,
+                    cover_paths.get(book_data["asin"]),
+                ): file_path
+                for file_path, book_data in books
+            }
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Tagging files",
+                mininterval=0.5,
+                dynamic_ncols=True,
+            ):
+                success = future.result()
+                self._report_result(futures[future], success)
+                processed += success
+        return processed
+
+    def _iter_m4b_with_asin(self, root: Path, read_asin: bool = True):
+        """Walk root once, yielding (path, asin, stat) for every .m4b file.
+
+        The ASIN header is read right after the directory entry is listed so
+        later stages never need to reopen the file. asin is None when read_asin
+        is False or the file carries no ASIN tag.
+        """
+        for entry in _iter_m4b(
+            root, lambda e: self.logger.warning(f"Could not scan directory: {e}")
+        ):
+            file_path = Path(entry.path)
+            st = entry.stat()
+            asin = self.extract_asin_from_file(file_path, st) if read_asin else None
+            yield file_path, asin, st
+
+    def extract_asin_from_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Optional[str]:
         """Extract ASIN from existing tags in an M4B file"""
+        # Unchanged files are answered from the ledger with a single stat call
+        key = str(file_path)
+        try:
+            if st is None:
+                st = os.stat(file_path)
+        except OSError as e:
+            self.logger.warning(f"Error extracting ASIN from {file_path}: {e}")
+            return None
+
+        cached = self._asin_ledger.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        asin = self._read_asin_from_file(file_path)
+        self._asin_ledger[key] = [st.st_mtime_ns, st.st_size, asin]
+        self._asin_ledger_dirty = True
+        return asin
+
+    def _read_asin_from_file(self, file_path: Path) -> Optional[str]:
+        """Read the ASIN tag from an M4B file on disk"""
+        # Header-only read; fall back to a full mutagen parse if the layout is unusual
+        try:
+            asin = _fast_extract_asin(file_path)
+            if asin:
+                self.logger.info(f"Found ASIN in {file_path.name}: {asin}")
+            return asin
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.debug(f"Fast ASIN scan failed for {file_path}: {e}")
+
         try:
             audio = MP4(file_path)
             if not audio.tags:
@@ -1688,19 +2676,19 @@ class AudibleTagger:
                 if tag_name in audio.tags:
                     asin_value = audio.tags[tag_name]
                     if isinstance(asin_value, list) and len(asin_value) > 0:
-                        # Handle MP4FreeForm objects
-                        if hasattr(asin_value[0], "decode"):
-                            asin = asin_value[0].decode("utf-8", errors="replace")
-                        else:
-                            asin = str(asin_value[0])
+                        raw = asin_value[0]
+                        # MP4FreeForm values are bytes; only text tags need encoding
+                        if not isinstance(raw, (bytes, bytearray)):
+                            raw = str(raw).encode("utf-8")
+
+                        # ASINs are typically 10 characters; skip short values undecoded
+                        raw = raw.strip()
+                        if len(raw) < 10:
+                            continue
 
-                        # Clean up the ASIN value
-                        asin = asin.strip()
-                        if (
-                            asin and len(asin) >= 10
-                        ):  # ASINs are typically 10 characters
-                            self.logger.info(f"Found ASIN in {file_path.name}: {asin}")
-                            return asin
+                        asin = raw.decode("utf-8", errors="replace")
+                        self.logger.info(f"Found ASIN in {file_path.name}: {asin}")
+                        return asin
 
             return None
 
@@ -1708,30 +2696,43 @@ class AudibleTagger:
             self.logger.warning(f"Error extracting ASIN from {file_path}: {e}")
             return None
 
-    def auto_process_file(self, file_path: Path) -> tuple[bool, Optional[str]]:
-        """Automatically process a file if it has an ASIN tag. Returns (success, asin)"""
-        try:
-            # Extract ASIN from existing tags
+    def _auto_lookup(
+        self, file_path: Path, asin: Optional[str] = None, time_budget_s: float = 8.0
+    ) -> Optional[Tuple[str, Dict, Optional[str]]]:
+        """Resolve ASIN, book details and cover for a file. Returns None if it can't be auto-processed"""
+        # A stalled Audible mirror must not hold up the rest of the batch
+        deadline = time.monotonic() + time_budget_s
+
+        # Extract ASIN from existing tags unless the scan already did
+        if asin is None:
             asin = self.extract_asin_from_file(file_path)
-            if not asin:
-                return False, None
+        if not asin:
+            return None
 
-            self.logger.info(f"Auto-processing {file_path.name} with ASIN: {asin}")
+        self.logger.info(f"Auto-processing {file_path.name} with ASIN: {asin}")
 
-            # Get book details using the ASIN
-            book_data = self.get_book_details(
-                asin, self.config.get("preferred_locale", "com")
-            )
-            if not book_data:
-                self.logger.error(f"Failed to get book details for ASIN: {asin}")
-                return False, None
+        # Get book details using the ASIN
+        book_data = self.get_book_details(
+            asin, self.config.get("preferred_locale", "com"), deadline=deadline
+        )
+        if not book_data:
+            self.logger.error(f"Failed to get book details for ASIN: {asin}")
+            return None
 
-            # Download cover
-            cover_path = None
-            if book_data.get("cover_url"):
-                cover_path = self.download_cover(
-                    book_data["cover_url"], book_data["asin"]
-                )
+        # Download cover
+        cover_path = None
+        if book_data.get("cover_url"):
+            cover_path = self.download_cover(book_data["cover_url"], book_data["asin"])
+
+        return asin, book_data, cover_path
+
+    def auto_process_file(self, file_path: Path) -> tuple[bool, Optional[str]]:
+        """Automatically process a file if it has an ASIN tag. Returns (success, asin)"""
+        try:
+            lookup = self._auto_lookup(file_path)
+            if not lookup:
+                return False, None
+            asin, book_data, cover_path = lookup
 
             # Tag the file
             if self.tag_file(file_path, book_data, cover_path):
@@ -1746,16 +2747,144 @@ class AudibleTagger:
                 return False, None
 
         except Exception as e:
-            self.logger.error(f"Error in auto-processing for {file_path}: {e}")
-            import traceback
-
-            self.logger.error(f"Full traceback: {traceback.format_exc()}")
+            self.logger.exception(
+                "Error in auto-processing for %s: %s", file_path, e
+            )
             return False, None
 
-    def process_file_with_auto_fallback(self, file_path: Path) -> bool:
+    def process_batch_auto(
+        self,
+        file_paths: List[Path],
+        asins: Optional[Dict[Path, Optional[str]]] = None,
+    ) -> Tuple[int, List[Path]]:
+        """Auto-process a batch of files, overlapping API lookups, tagging and moves.
+
+        Each file flows through lookup -> tag -> move stages backed by separate
+        thread pools, so network waits for one book overlap with disk work for
+        another. Returns the number of processed files and the files that could
+        not be auto-processed and need the interactive flow. ASINs already read
+        during the directory scan can be passed in to avoid reopening files.
+        """
+        # Bound the number of files in flight to keep open handles in check
+        in_flight = threading.BoundedSemaphore(32)
+        needs_interactive: List[Path] = []
+        processed = 0
+        lock = threading.Lock()
+
+        lookup_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="lookup")
+        tag_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="tag"
+        )
+        move_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="move")
+        progress = tqdm(
+            total=len(file_paths),
+            desc="Auto-processing files",
+            mininterval=0.5,
+            dynamic_ncols=True,
+        )
+
+        def finish(done: Future, file_path: Path, success: bool) -> None:
+            nonlocal processed
+            with lock:
+                if success:
+                    processed += 1
+                else:
+                    needs_interactive.append(file_path)
+            progress.update(1)
+            in_flight.release()
+            done.set_result(success)
+
+        def after_move(future: Future, file_path: Path, done: Future) -> None:
+            try:
+                future.result()
+                self.logger.info(f"Successfully auto-processed: {file_path.name}")
+                finish(done, file_path, True)
+            except Exception as e:
+                self.logger.exception(
+                    "Error in auto-processing for %s: %s", file_path, e
+                )
+                finish(done, file_path, False)
+
+        def after_tag(
+            future: Future, file_path: Path, lookup, done: Future
+        ) -> None:
+            try:
+                if not future.result():
+                    self.logger.error(
+                        f"Failed to tag file during auto-processing: {file_path}"
+                    )
+                    finish(done, file_path, False)
+                    return
+                _, book_data, cover_path = lookup
+                move_pool.submit(
+                    self.move_to_library, file_path, book_data, cover_path
+                ).add_done_callback(lambda f: after_move(f, file_path, done))
+            except Exception as e:
+                self.logger.exception(
+                    "Error in auto-processing for %s: %s", file_path, e
+                )
+                finish(done, file_path, False)
+
+        def after_lookup(future: Future, file_path: Path, done: Future) -> None:
+            try:
+                lookup = future.result()
+                if not lookup:
+                    finish(done, file_path, False)
+                    return
+                _, book_data, cover_path = lookup
+                tag_pool.submit(
+                    self.tag_file, file_path, book_data, cover_path
+                ).add_done_callback(
+                    lambda f: after_tag(f, file_path, lookup, done)
+                )
+            except Exception as e:
+                self.logger.exception(
+                    "Error in auto-processing for %s: %s", file_path, e
+                )
+                finish(done, file_path, False)
+
+        try:
+            pending = []
+            for file_path in file_paths:
+                asin = asins.get(file_path) if asins is not None else None
+                if asins is not None and not asin:
+                    # The scan found no ASIN tag, nothing to look up
+                    needs_interactive.append(file_path)
+                    progress.update(1)
+                    continue
+
+                in_flight.acquire()
+                done = Future()
+                pending.append(done)
+                lookup_pool.submit(
+                    self._auto_lookup, file_path, asin
+                ).add_done_callback(
+                    lambda f, file_path=file_path, done=done: after_lookup(
+                        f, file_path, done
+                    )
+                )
+            wait(pending)
+        finally:
+            lookup_pool.shutdown()
+            tag_pool.shutdown()
+            move_pool.shutdown()
+            progress.close()
+
+        # Keep the interactive fallback in the original scan order
+        order = {path: i for i, path in enumerate(file_paths)}
+        needs_interactive.sort(key=order.__getitem__)
+        return processed, needs_interactive
+
+    def process_file_with_auto_fallback(
+        self, file_path: Path, auto: Optional[bool] = None
+    ) -> bool:
         """Process a file with auto-tagging fallback - try auto first, then interactive if no ASIN"""
+        # Batch callers resolve the auto-tag flag once and pass it in
+        if auto is None:
+            auto = self.config.get("auto_tag_enabled", False)
+
         # First try auto-processing
-        if self.config.get("auto_tag_enabled", False):
+        if auto:
             success, _ = self.auto_process_file(file_path)
             if success:
                 return True
@@ -1769,5 +2898,5 @@ class AudibleTagger:
 
 
 if __name__ == "__main__":
-    tagger = AudibleTagger()
-    tagger.run()
+    with AudibleTagger() as tagger:
+        tagger.run()
@@ -7,9 +7,17 @@ Handles interactive commands for processing audiobooks via Telegram
 import os
 import sys
 import logging
-import requests
+import logging.handlers
+import queue
+import asyncio
+import json
 import traceback
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from cachetools import LRUCache, TTLCache
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
 from telegram.ext import (
     Application,
@@ -20,25 +28,150 @@ from telegram.ext import (
     filters,
 )
 
+# API server responses can be long lists; orjson decodes them faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 # Add the current directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from translations import get_text, get_supported_languages
+from translations import get_template, get_text, get_supported_languages
+
+# Languages are fixed at import time, so resolve them and their labels once
+_SUPPORTED_LANGUAGES = get_supported_languages()
+_LANGUAGE_NAMES = {
+    "en": "🇺🇸 English",
+    "fr": "🇫🇷 Français",
+    "es": "🇪🇸 Español",
+    "it": "🇮🇹 Italiano",
+    "de": "🇩🇪 Deutsch",
+}
+
+# Plain text messages (custom search queries), composed once
+_TEXT_NON_COMMAND = filters.TEXT & ~filters.COMMAND
+
+# API server calls fail fast when the server is down or a request hangs, so one
+# stuck request can't hold a handler (and a pooled connection) forever
+_API_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=3)
+# Searches run against Audible within a ~30 s server-side budget; wait well past
+# it so the bot doesn't give up on a search the server is still finishing
+_API_SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=90, connect=3)
+# Tagging and moving a book runs inside the request, which can take minutes
+_API_PROCESS_TIMEOUT = aiohttp.ClientTimeout(total=600, connect=3)
+
+
+def _ok(data: Dict) -> bool:
+    """Whether an API server response reports success"""
+    return data.get("status") == "success"
+
+
+def _error_message(data: Dict, language: str) -> str:
+    """Error message of a failed API server response"""
+    return data.get("message") or get_text("error_unknown", language)
+
+
+@lru_cache(maxsize=None)
+def _error_template(language: str) -> str:
+    """Error reply template taking the error message and the exception type"""
+    return (
+        get_template("error_generic", language)
+        + "\n\n"
+        + get_template("error_debug_info", language)
+    )
+
+
+def setup_logging() -> Optional[logging.handlers.QueueListener]:
+    """Setup logging for the Telegram bot process
+
+    Handlers only enqueue records; a listener thread does the file and console
+    writes so logging never blocks the event loop. Returns the listener to stop
+    on exit, or None if logging was already configured.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    handlers = [logging.StreamHandler()]
+
+    # Create logs directory if it doesn't exist
+    logs_dir = Path("logs")
+    log_file = logs_dir / "telegram_bot.log"
+
+    # Try to set up file logging, fallback to console only if it fails
+    file_error = None
+    try:
+        logs_dir.mkdir(exist_ok=True)
+        handlers.append(logging.FileHandler(log_file))
+    except Exception as e:
+        file_error = e
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+
+    logger = logging.getLogger(__name__)
+    if file_error is None:
+        logger.info(f"Telegram Bot logging initialized. Log file: {log_file}")
+    elif isinstance(file_error, PermissionError):
+        logger.warning(
+            f"Permission denied writing to {log_file}, using console logging only"
+        )
+    else:
+        logger.error(
+            f"Error setting up file logging: {file_error}, using console logging only"
+        )
+    return listener
 
 
 class AudiobookTelegramBot:
     """Telegram bot for audiobook processing"""
 
+    # Labels of the per-book buttons in /list
+    SEARCH_LABEL = "🔍"  # Magnifying glass emoji
+    SKIP_LABEL = "⏭️"  # Skip arrows emoji
+
     def __init__(self, api_url: str, token: str):
-        # Setup logging first
-        self.setup_logging()
+        self.logger = logging.getLogger(__name__)
 
         self.api_url = api_url.rstrip("/")
         self.token = token
-        self.app = Application.builder().token(token).build()
+        self.app = (
+            Application.builder()
+            .token(token)
+            .post_init(self._post_init)
+            .post_shutdown(self._post_shutdown)
+            .build()
+        )
+
+        # Non-blocking HTTP client, opened with the application's event loop
+        self.http: Optional[aiohttp.ClientSession] = None
+        # In-flight GETs, so identical concurrent requests share one call
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
 
         # Track custom search conversations
-        self.custom_search_states = {}  # user_id -> (file_id, message_id)
+        # user_id -> (file_id, message_id); abandoned searches expire after 5 minutes
+        self.custom_search_states = TTLCache(maxsize=1000, ttl=300)
+        # file_id -> query of the last automatic search shown for it
+        self.original_queries = TTLCache(maxsize=1000, ttl=3600)
 
         # Check for n8n webhook URL
         self.n8n_webhook_url = os.getenv("N8N_NEW_RELEASES_WEBHOOK_URL")
@@ -51,84 +184,135 @@ class AudiobookTelegramBot:
 
         # Language settings
         self.default_language = os.getenv("BOT_LANGUAGE", "en")
-        self.user_languages = {}  # user_id -> language
+        # user_id -> language, bounded so one-off users don't accumulate forever
+        self.user_languages = LRUCache(maxsize=10_000)
+
+        # Translations and the n8n setting are fixed for the bot's lifetime, so the
+        # /start text and /language menus are rendered once per language, when a
+        # user first needs them (only languages in use get their locale loaded).
+        # Keys are supported languages plus the default, so the caches stay small
+        self._welcome_cache: Dict[str, str] = {}
+        self._language_menu_cache: Dict[str, Tuple[str, InlineKeyboardMarkup]] = {}
+
+        # Inline button actions -> handlers taking (query, *args)
+        self._callback_dispatch = {
+            "search": self.handle_search_callback,
+            "custom_search": self.handle_custom_search_callback,
+            "skip": self.handle_skip_callback,
+            "process": self.handle_process_callback,
+            "language": self.handle_language_callback,
+        }
 
         # Register handlers
         self.register_handlers()
 
+        # Report the per-user state size hourly; job_queue comes from the job-queue
+        # extra in requirements.txt and is None if an install is missing it
+        if self.app.job_queue is not None:
+            self.app.job_queue.run_repeating(
+                self._log_state_sizes, interval=3600, first=3600
+            )
+
+    async def _post_init(self, application: Application) -> None:
+        """Open the shared HTTP session and set the command menu once the bot starts"""
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=16, keepalive_timeout=60
+            ),
+            timeout=_API_TIMEOUT,
+            json_serialize=_dumps,
+        )
+
+        # The command list is static, so it is sent to Telegram once at startup
+        await self.setup_bot_commands()
+
+    async def _post_shutdown(self, application: Application) -> None:
+        """Close the shared HTTP session"""
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+
+    async def _api_get(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        timeout: aiohttp.ClientTimeout = _API_TIMEOUT,
+    ) -> Dict:
+        """GET an API server endpoint without blocking the event loop"""
+        async with self.http.get(
+            f"{self.api_url}{path}", params=params, timeout=timeout
+        ) as response:
+            return _loads(await response.read())
+
+    async def _api_get_shared(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        timeout: aiohttp.ClientTimeout = _API_TIMEOUT,
+    ) -> Dict:
+        """GET an API server endpoint, joining an identical request already in flight"""
+        key = (path, tuple(sorted(params.items())) if params else ())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._api_get(path, params, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # One caller giving up must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _api_post(
+        self,
+        path: str,
+        payload: Optional[Dict] = None,
+        timeout: aiohttp.ClientTimeout = _API_TIMEOUT,
+    ) -> Dict:
+        """POST to an API server endpoint without blocking the event loop"""
+        async with self.http.post(
+            f"{self.api_url}{path}", json=payload, timeout=timeout
+        ) as response:
+            return _loads(await response.read())
+
+    async def _reply_exception(
+        self, reply, exc: Exception, language: str, context: str
+    ) -> None:
+        """Log an unexpected handler error and report it to the user with reply"""
+        self.logger.error(f"{context}: {exc}")
+        self.logger.error(f"Full traceback: {traceback.format_exc()}")
+        await reply(_error_template(language).format(str(exc), type(exc).__name__))
+
+    async def _log_state_sizes(self, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Log how many users have a language or a pending custom search"""
+        self.logger.info(
+            f"State sizes: {len(self.user_languages)} user languages, "
+            f"{len(self.custom_search_states)} pending custom searches"
+        )
+
     def get_user_language(self, user_id: int) -> str:
         """Get language for a specific user, fallback to default"""
         return self.user_languages.get(user_id, self.default_language)
 
     def set_user_language(self, user_id: int, language: str):
         """Set language for a specific user"""
-        if language in get_supported_languages():
+        if language in _SUPPORTED_LANGUAGES:
             self.user_languages[user_id] = language
 
-    def setup_logging(self):
-        """Setup logging for Telegram bot"""
-        # Create logs directory if it doesn't exist
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-
-        # Use absolute path for log file
-        log_file = logs_dir / "telegram_bot.log"
-
-        # Try to set up file logging, fallback to console only if permission denied
-        try:
-            logging.basicConfig(
-                level=logging.INFO,
-                format="%(asctime)s - %(levelname)s - %(message)s",
-                handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-            )
-            self.logger = logging.getLogger(__name__)
-            self.logger.info(f"Telegram Bot logging initialized. Log file: {log_file}")
-        except PermissionError:
-            # Fallback to console logging only
-            logging.basicConfig(
-                level=logging.INFO,
-                format="%(asctime)s - %(levelname)s - %(message)s",
-                handlers=[logging.StreamHandler()],
-            )
-            self.logger = logging.getLogger(__name__)
-            self.logger.warning(
-                f"Permission denied writing to {log_file}, using console logging only"
-            )
-        except Exception as e:
-            # Fallback to console logging only
-            logging.basicConfig(
-                level=logging.INFO,
-                format="%(asctime)s - %(levelname)s - %(message)s",
-                handlers=[logging.StreamHandler()],
-            )
-            self.logger = logging.getLogger(__name__)
-            self.logger.error(
-                f"Error setting up file logging: {e}, using console logging only"
-            )
-
     def register_handlers(self):
         """Register all command and callback handlers"""
-        # Register command handlers
-        self.app.add_handler(CommandHandler("start", self.start_command))
-        self.app.add_handler(CommandHandler("list", self.list_command))
-        self.app.add_handler(CommandHandler("language", self.language_command))
-
+        commands = [
+            ("start", self.start_command),
+            ("list", self.list_command),
+            ("language", self.language_command),
+            ("auto", self.auto_command),
+        ]
         # Register n8n command if webhook URL is configured
         if self.n8n_webhook_url:
-            self.app.add_handler(
-                CommandHandler("getnewreleases", self.get_new_releases_command)
-            )
+            commands.append(("getnewreleases", self.get_new_releases_command))
 
-        # Register auto-tagging command
-        self.app.add_handler(CommandHandler("auto", self.auto_command))
-
-        # Register callback query handler for inline buttons
-        self.app.add_handler(CallbackQueryHandler(self.button_callback))
-
-        # Register message handler for custom search
-        self.app.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message)
-        )
+        handlers = [CommandHandler(name, callback) for name, callback in commands]
+        # Inline buttons, then free text for custom searches
+        handlers.append(CallbackQueryHandler(self.button_callback))
+        handlers.append(MessageHandler(_TEXT_NON_COMMAND, self.handle_message))
+        self.app.add_handlers(handlers)
 
     async def setup_bot_commands(self):
         """Set up the bot commands menu"""
@@ -154,33 +338,34 @@ class AudiobookTelegramBot:
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        # Set up bot commands on first start
-        try:
-            await self.setup_bot_commands()
-        except Exception as e:
-            self.logger.error(f"Failed to set up bot commands: {e}")
-
         user_id = update.effective_user.id
         language = self.get_user_language(user_id)
 
-        welcome_text = f"""
-{get_text('welcome_title', language)}
-
-{get_text('welcome_commands', language)}
-{get_text('welcome_list', language)}"""
+        welcome_text = self._welcome_cache.get(language)
+        if welcome_text is None:
+            welcome_text = self._render_welcome(language)
+            self._welcome_cache[language] = welcome_text
+        await update.message.reply_text(welcome_text)
+
+    def _render_welcome(self, language: str) -> str:
+        """Build the /start message for a language"""
+        lines = [
+            get_text("welcome_title", language),
+            "",
+            get_text("welcome_commands", language),
+            get_text("welcome_list", language),
+        ]
 
         # Add conditional commands
         if self.n8n_webhook_url:
-            welcome_text += f"""
-{get_text('welcome_getnewreleases', language)}"""
-
-        welcome_text += f"""
+            lines.append(get_text("welcome_getnewreleases", language))
 
-{get_text('welcome_help', language)}
-{get_text('welcome_buttons', language)}
-        """
-
-        await update.message.reply_text(welcome_text.strip())
+        lines += [
+            "",
+            get_text("welcome_help", language),
+            get_text("welcome_buttons", language),
+        ]
+        return "\n".join(lines)
 
     async def list_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /list command"""
@@ -188,10 +373,9 @@ class AudiobookTelegramBot:
         language = self.get_user_language(user_id)
 
         try:
-            response = requests.get(f"{self.api_url}/audiobooks")
-            data = response.json()
+            data = await self._api_get("/audiobooks")
 
-            if data["status"] == "success":
+            if _ok(data):
                 if data["count"] == 0:
                     await update.message.reply_text(get_text("list_no_books", language))
                     return
@@ -203,52 +387,46 @@ class AudiobookTelegramBot:
                 header_message = get_text("list_found_books", language, total_books)
                 await update.message.reply_text(header_message)
 
-                # Send each book as a separate message with individual action buttons
-                for i, book in enumerate(audiobooks, 1):
-                    # Create book message (simplified - no path, no ID, no index)
-                    book_message = get_text(
-                        "list_book_entry",
-                        language,
-                        book["parsed_title"],
-                        book["parsed_author"],
+                # One message per book (simplified - no path, no ID, no index) with
+                # emoji-only search/skip buttons, all built in a single pass
+                entry_template = get_template("list_book_entry", language)
+                book_messages = [
+                    (
+                        entry_template.format(
+                            book["parsed_title"], book["parsed_author"]
+                        ),
+                        InlineKeyboardMarkup(
+                            [
+                                [
+                                    InlineKeyboardButton(
+                                        self.SEARCH_LABEL,
+                                        callback_data=f"search:{book['id']}",
+                                    ),
+                                    InlineKeyboardButton(
+                                        self.SKIP_LABEL,
+                                        callback_data=f"skip:{book['id']}",
+                                    ),
+                                ]
+                            ]
+                        ),
                     )
+                    for book in audiobooks
+                ]
 
-                    # Create individual keyboard for this book with emoji-only buttons
-                    keyboard = [
-                        [
-                            InlineKeyboardButton(
-                                "🔍",  # Magnifying glass emoji
-                                callback_data=f"search:{book['id']}",
-                            ),
-                            InlineKeyboardButton(
-                                "⏭️",  # Skip arrows emoji
-                                callback_data=f"skip:{book['id']}",
-                            ),
-                        ]
-                    ]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-
+                # Send each book as a separate message with individual action buttons
+                for book_message, reply_markup in book_messages:
                     await update.message.reply_text(
                         book_message, reply_markup=reply_markup
                     )
 
             else:
                 await update.message.reply_text(
-                    get_text(
-                        "list_error",
-                        language,
-                        data.get("message", get_text("error_unknown", language)),
-                    )
+                    get_text("list_error", language, _error_message(data, language))
                 )
 
         except Exception as e:
-            self.logger.error(f"Error in list command: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await update.message.reply_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                update.message.reply_text, e, language, "Error in list command"
             )
 
     async def get_new_releases_command(
@@ -266,33 +444,34 @@ class AudiobookTelegramBot:
 
         try:
             # Send GET request to n8n webhook
-            response = requests.get(self.n8n_webhook_url, timeout=30)
+            async with self.http.get(
+                self.n8n_webhook_url, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                status = response.status
 
-            if response.status_code == 200:
+            if status == 200:
                 await update.message.reply_text(
                     get_text("getnewreleases_success", language)
                 )
             else:
                 await update.message.reply_text(
-                    get_text("getnewreleases_failed", language, response.status_code)
+                    get_text("getnewreleases_failed", language, status)
                 )
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             await update.message.reply_text(
                 get_text("getnewreleases_timeout", language)
             )
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectionError:
             await update.message.reply_text(
                 get_text("getnewreleases_connection_error", language)
             )
         except Exception as e:
-            self.logger.error(f"Error in getNewReleases command: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await update.message.reply_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                update.message.reply_text,
+                e,
+                language,
+                "Error in getNewReleases command",
             )
 
     async def language_command(
@@ -302,24 +481,26 @@ class AudiobookTelegramBot:
         user_id = update.effective_user.id
         current_language = self.get_user_language(user_id)
 
-        # Get supported languages
-        supported_languages = get_supported_languages()
+        menu = self._language_menu_cache.get(current_language)
+        if menu is None:
+            menu = self._render_language_menu(current_language)
+            self._language_menu_cache[current_language] = menu
+        message, reply_markup = menu
+
+        await update.message.reply_text(message, reply_markup=reply_markup)
 
+    def _render_language_menu(
+        self, current_language: str
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build the /language message and keyboard for a user's current language"""
         # Create message with current language and available options
         message = f"🌍 Current Language: {current_language.upper()}\n\n"
         message += "Available Languages:\n"
 
         # Create inline keyboard for language selection
         keyboard = []
-        language_names = {
-            "en": "🇺🇸 English",
-            "fr": "🇫🇷 Français",
-            "es": "🇪🇸 Español",
-            "it": "🇮🇹 Italiano",
-            "de": "🇩🇪 Deutsch",
-        }
-        for lang_code in supported_languages:
-            lang_name = language_names.get(lang_code, lang_code.upper())
+        for lang_code in _SUPPORTED_LANGUAGES:
+            lang_name = _LANGUAGE_NAMES.get(lang_code, lang_code.upper())
             keyboard.append(
                 [
                     InlineKeyboardButton(
@@ -329,34 +510,18 @@ class AudiobookTelegramBot:
                 ]
             )
 
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.message.reply_text(message.strip(), reply_markup=reply_markup)
+        return message.strip(), InlineKeyboardMarkup(keyboard)
 
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline button callbacks"""
         query = update.callback_query
         await query.answer()
 
-        data = query.data
-        parts = data.split(":")
-
-        if parts[0] == "search":
-            file_id = parts[1]
-            await self.handle_search_callback(query, file_id)
-        elif parts[0] == "custom_search":
-            file_id = parts[1]
-            await self.handle_custom_search_callback(query, file_id)
-        elif parts[0] == "skip":
-            file_id = parts[1]
-            await self.handle_skip_callback(query, file_id)
-        elif parts[0] == "process":
-            file_id = parts[1]
-            selection_id = parts[2]
-            await self.handle_process_callback(query, file_id, selection_id)
-        elif parts[0] == "language":
-            lang_code = parts[1]
-            await self.handle_language_callback(query, lang_code)
+        # Callback data is "<action>:<arg>[:<arg>]"
+        action, _, args = query.data.partition(":")
+        handler = self._callback_dispatch.get(action)
+        if handler is not None:
+            await handler(query, *args.split(":"))
 
     async def handle_search_callback(self, query, file_id):
         """Handle search button callback"""
@@ -364,31 +529,26 @@ class AudiobookTelegramBot:
         language = self.get_user_language(user_id)
 
         try:
-            response = requests.get(f"{self.api_url}/audiobooks/{file_id}/search")
-            data = response.json()
+            data = await self._api_get_shared(
+                f"/audiobooks/{file_id}/search", timeout=_API_SEARCH_TIMEOUT
+            )
 
-            if data["status"] == "success":
+            if _ok(data):
                 results = data["results"]
+                # Remembered for the custom search prompt, which shows it as context
+                self.original_queries[file_id] = data["search_query"]
 
                 if not results:
                     # No results found - offer custom search option
-                    message = (
-                        get_text(
-                            "search_no_results",
-                            language,
-                            data["filename"],
-                        )
-                        + "\n\n"
-                    )
-                    message += (
-                        get_text(
-                            "search_query_used",
-                            language,
-                            data["search_query"],
+                    message = "\n\n".join(
+                        (
+                            get_text("search_no_results", language, data["filename"]),
+                            get_text(
+                                "search_query_used", language, data["search_query"]
+                            ),
+                            get_text("search_try_custom", language),
                         )
-                        + "\n\n"
                     )
-                    message += get_text("search_try_custom", language)
 
                     # Create keyboard with custom search option
                     keyboard = [
@@ -406,106 +566,84 @@ class AudiobookTelegramBot:
                     )
                     return
 
-                # Create message with search results
-                message = (
-                    get_text(
-                        "search_results_title",
-                        language,
-                        data["filename"],
-                    )
-                    + "\n\n"
-                )
-                message += (
-                    get_text(
-                        "search_query",
-                        language,
-                        data["search_query"],
-                    )
-                    + "\n\n"
-                )
-
-                for i, result in enumerate(results, 1):
-                    message += (
-                        get_text(
-                            "search_result_entry",
-                            language,
-                            i,
-                            result["title"],
-                            result["author"],
-                        )
-                        + "\n"
-                    )
-                    if result.get("narrator"):
-                        message += (
-                            get_text(
-                                "search_narrated_by",
-                                language,
-                                result["narrator"],
-                            )
-                            + "\n"
-                        )
-                    if result.get("series"):
-                        series_text = result["series"]
-                        if result.get("series_part"):
-                            series_text += f" #{result['series_part']}"
-                        message += (
-                            get_text(
-                                "search_series",
-                                language,
-                                series_text,
-                            )
-                            + "\n"
-                        )
-                    message += (
-                        get_text("search_asin", language, result["asin"]) + "\n\n"
-                    )
-
-                # Create inline keyboard for selection
-                keyboard = []
-                for i, result in enumerate(results, 1):
-                    keyboard.append(
-                        [
-                            InlineKeyboardButton(
-                                get_text("search_select_option", language, i),
-                                callback_data=f"process:{file_id}:{result['selection_id']}",
-                            )
-                        ]
-                    )
-
-                # Add custom search option at the bottom
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            get_text("search_custom_option", language),
-                            callback_data=f"custom_search:{file_id}",
-                        )
-                    ]
+                # Create message and selection keyboard with search results
+                message, reply_markup = self._render_search_results(
+                    "search_results_title",
+                    file_id,
+                    data["filename"],
+                    data["search_query"],
+                    results,
+                    language,
                 )
 
-                reply_markup = InlineKeyboardMarkup(keyboard)
-
-                await query.edit_message_text(
-                    message.strip(), reply_markup=reply_markup
-                )
+                await query.edit_message_text(message, reply_markup=reply_markup)
             else:
                 await query.edit_message_text(
-                    get_text(
-                        "error_generic",
-                        language,
-                        data.get("message", get_text("error_unknown", language)),
-                    )
+                    get_text("error_generic", language, _error_message(data, language))
                 )
 
         except Exception as e:
-            self.logger.error(f"Error in search callback: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await query.edit_message_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                query.edit_message_text, e, language, "Error in search callback"
+            )
+
+    def _render_search_results(
+        self,
+        title_key: str,
+        file_id: str,
+        filename: str,
+        search_query: str,
+        results,
+        language,
+    ) -> Tuple[str, InlineKeyboardMarkup]:
+        """Build the search results message and keyboard shared by both search flows"""
+        # Resolve each per-result template once and format it in the loop
+        entry_template = get_template("search_result_entry", language)
+        narrator_template = get_template("search_narrated_by", language)
+        series_template = get_template("search_series", language)
+        asin_template = get_template("search_asin", language)
+        select_template = get_template("search_select_option", language)
+
+        lines = [
+            get_text(title_key, language, filename),
+            "",
+            get_text("search_query", language, search_query),
+            "",
+        ]
+        keyboard = []
+        for i, result in enumerate(results, 1):
+            lines.append(entry_template.format(i, result["title"], result["author"]))
+            if result.get("narrator"):
+                lines.append(narrator_template.format(result["narrator"]))
+            if result.get("series"):
+                series_text = result["series"]
+                if result.get("series_part"):
+                    series_text += f" #{result['series_part']}"
+                lines.append(series_template.format(series_text))
+            lines.append(asin_template.format(result["asin"]))
+            lines.append("")
+
+            keyboard.append(
+                [
+                    InlineKeyboardButton(
+                        select_template.format(i),
+                        callback_data=f"process:{file_id}:{result['selection_id']}",
+                    )
+                ]
             )
 
+        # Add custom search option at the bottom
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    get_text("search_custom_option", language),
+                    callback_data=f"custom_search:{file_id}",
+                )
+            ]
+        )
+
+        return "\n".join(lines).strip(), InlineKeyboardMarkup(keyboard)
+
     async def handle_custom_search_callback(self, query, file_id):
         """Handle custom search button callback"""
         user_id = query.from_user.id
@@ -515,42 +653,37 @@ class AudiobookTelegramBot:
             # Store the custom search state
             self.custom_search_states[user_id] = (file_id, query.message.message_id)
 
-            # Try to get the original search query for context
-            try:
-                response = requests.get(f"{self.api_url}/audiobooks/{file_id}/search")
-                data = response.json()
-                original_query = data.get("search_query", "unknown")
-            except:
-                original_query = "unknown"
-
-            message = get_text("custom_search_title", language, file_id) + "\n\n"
-            message += (
-                get_text(
-                    "custom_search_original",
-                    language,
-                    original_query,
+            # Show the query from the search that offered this button, without
+            # re-running the whole Audible search just to display it
+            original_query = self.original_queries.get(file_id, "unknown")
+
+            lines = [
+                get_text("custom_search_title", language, file_id),
+                "",
+                get_text("custom_search_original", language, original_query),
+                "",
+            ]
+            lines.extend(
+                get_text(key, language)
+                for key in (
+                    "custom_search_instructions",
+                    "custom_search_examples",
+                    "custom_search_book_title",
+                    "custom_search_author",
+                    "custom_search_title_author",
+                    "custom_search_series",
+                    "custom_search_spelling",
                 )
-                + "\n\n"
             )
-            message += get_text("custom_search_instructions", language) + "\n"
-            message += get_text("custom_search_examples", language) + "\n"
-            message += get_text("custom_search_book_title", language) + "\n"
-            message += get_text("custom_search_author", language) + "\n"
-            message += get_text("custom_search_title_author", language) + "\n"
-            message += get_text("custom_search_series", language) + "\n"
-            message += get_text("custom_search_spelling", language) + "\n\n"
-            message += get_text("custom_search_type_now", language)
+            lines.append("")
+            lines.append(get_text("custom_search_type_now", language))
+            message = "\n".join(lines)
 
-            await query.edit_message_text(message.strip())
+            await query.edit_message_text(message)
 
         except Exception as e:
-            self.logger.error(f"Error in custom search callback: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await query.edit_message_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                query.edit_message_text, e, language, "Error in custom search callback"
             )
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -559,8 +692,9 @@ class AudiobookTelegramBot:
         language = self.get_user_language(user_id)
 
         # Check if user is in custom search state
-        if user_id in self.custom_search_states:
-            file_id, message_id = self.custom_search_states[user_id]
+        state = self.custom_search_states.get(user_id)
+        if state is not None:
+            file_id, message_id = state
             search_query = update.message.text.strip()
 
             if not search_query:
@@ -571,7 +705,7 @@ class AudiobookTelegramBot:
 
             try:
                 # Clear the custom search state
-                del self.custom_search_states[user_id]
+                self.custom_search_states.pop(user_id, None)
 
                 # Show processing message
                 await update.message.reply_text(
@@ -583,13 +717,13 @@ class AudiobookTelegramBot:
                 )
 
                 # Make custom search request
-                response = requests.post(
-                    f"{self.api_url}/audiobooks/{file_id}/search/custom",
-                    json={"search_query": search_query},
+                data = await self._api_post(
+                    f"/audiobooks/{file_id}/search/custom",
+                    {"search_query": search_query},
+                    timeout=_API_SEARCH_TIMEOUT,
                 )
-                data = response.json()
 
-                if data["status"] == "success":
+                if _ok(data):
                     results = data["results"]
 
                     if not results:
@@ -604,97 +738,27 @@ class AudiobookTelegramBot:
                         )
                         return
 
-                    # Create message with search results
-                    message = (
-                        get_text(
-                            "custom_search_results_title",
-                            language,
-                            data["filename"],
-                        )
-                        + "\n\n"
-                    )
-                    message += get_text("search_query", language, search_query) + "\n\n"
-
-                    for i, result in enumerate(results, 1):
-                        message += (
-                            get_text(
-                                "search_result_entry",
-                                language,
-                                i,
-                                result["title"],
-                                result["author"],
-                            )
-                            + "\n"
-                        )
-                        if result.get("narrator"):
-                            message += (
-                                get_text(
-                                    "search_narrated_by",
-                                    language,
-                                    result["narrator"],
-                                )
-                                + "\n"
-                            )
-                        if result.get("series"):
-                            series_text = result["series"]
-                            if result.get("series_part"):
-                                series_text += f" #{result['series_part']}"
-                            message += (
-                                get_text(
-                                    "search_series",
-                                    language,
-                                    series_text,
-                                )
-                                + "\n"
-                            )
-                        message += (
-                            get_text("search_asin", language, result["asin"]) + "\n\n"
-                        )
-
-                    # Create inline keyboard for selection
-                    keyboard = []
-                    for i, result in enumerate(results, 1):
-                        keyboard.append(
-                            [
-                                InlineKeyboardButton(
-                                    get_text("search_select_option", language, i),
-                                    callback_data=f"process:{file_id}:{result['selection_id']}",
-                                )
-                            ]
-                        )
-
-                    # Add custom search option at the bottom
-                    keyboard.append(
-                        [
-                            InlineKeyboardButton(
-                                get_text("search_custom_option", language),
-                                callback_data=f"custom_search:{file_id}",
-                            )
-                        ]
+                    # Create message and selection keyboard with search results
+                    message, reply_markup = self._render_search_results(
+                        "custom_search_results_title",
+                        file_id,
+                        data["filename"],
+                        search_query,
+                        results,
+                        language,
                     )
 
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-
-                    await update.message.reply_text(
-                        message.strip(), reply_markup=reply_markup
-                    )
+                    await update.message.reply_text(message, reply_markup=reply_markup)
                 else:
                     await update.message.reply_text(
                         get_text(
-                            "error_generic",
-                            language,
-                            data.get("message", get_text("error_unknown", language)),
+                            "error_generic", language, _error_message(data, language)
                         )
                     )
 
             except Exception as e:
-                self.logger.error(f"Error in custom search: {e}")
-                error_details = traceback.format_exc()
-                self.logger.error(f"Full traceback: {error_details}")
-                await update.message.reply_text(
-                    get_text("error_generic", language, str(e))
-                    + "\n\n"
-                    + get_text("error_debug_info", language, type(e).__name__)
+                await self._reply_exception(
+                    update.message.reply_text, e, language, "Error in custom search"
                 )
 
     async def handle_skip_callback(self, query, file_id):
@@ -703,30 +767,20 @@ class AudiobookTelegramBot:
         language = self.get_user_language(user_id)
 
         try:
-            response = requests.post(f"{self.api_url}/audiobooks/{file_id}/skip")
-            data = response.json()
+            data = await self._api_post(f"/audiobooks/{file_id}/skip")
 
-            if data["status"] == "success":
+            if _ok(data):
                 message = get_text("skip_success", language, data["filename"]) + "\n"
                 message += get_text("skip_moved_to", language, data["moved_to"])
                 await query.edit_message_text(message.strip())
             else:
                 await query.edit_message_text(
-                    get_text(
-                        "error_generic",
-                        language,
-                        data.get("message", get_text("error_unknown", language)),
-                    )
+                    get_text("error_generic", language, _error_message(data, language))
                 )
 
         except Exception as e:
-            self.logger.error(f"Error in skip callback: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await query.edit_message_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                query.edit_message_text, e, language, "Error in skip callback"
             )
 
     async def handle_process_callback(self, query, file_id, selection_id):
@@ -739,99 +793,56 @@ class AudiobookTelegramBot:
             await query.edit_message_text(get_text("processing_start", language))
 
             # Process the audiobook
-            response = requests.get(
-                f"{self.api_url}/audiobooks/{file_id}/process?selection_id={selection_id}"
+            data = await self._api_get_shared(
+                f"/audiobooks/{file_id}/process",
+                {"selection_id": selection_id},
+                timeout=_API_PROCESS_TIMEOUT,
             )
-            data = response.json()
 
-            if data["status"] == "success":
+            if _ok(data):
                 # Build success message with metadata
-                message = (
-                    get_text(
-                        "processing_success",
-                        language,
-                        data["filename"],
-                    )
-                    + "\n\n"
-                )
-                message += get_text("processing_metadata", language) + "\n"
-                message += (
-                    get_text(
-                        "processing_title",
-                        language,
-                        data["metadata"]["title"],
-                    )
-                    + "\n"
-                )
-                message += (
-                    get_text(
-                        "processing_author",
-                        language,
-                        data["metadata"]["author"],
-                    )
-                    + "\n"
-                )
+                metadata = data["metadata"]
+                lines = [
+                    get_text("processing_success", language, data["filename"]),
+                    "",
+                    get_text("processing_metadata", language),
+                    get_text("processing_title", language, metadata["title"]),
+                    get_text("processing_author", language, metadata["author"]),
+                ]
 
-                if data["metadata"].get("narrator"):
-                    message += (
-                        get_text(
-                            "processing_narrator",
-                            language,
-                            data["metadata"]["narrator"],
-                        )
-                        + "\n"
+                if metadata.get("narrator"):
+                    lines.append(
+                        get_text("processing_narrator", language, metadata["narrator"])
                     )
 
-                if data["metadata"].get("series"):
-                    series_text = data["metadata"]["series"]
-                    if data["metadata"].get("series_part"):
+                if metadata.get("series"):
+                    series_text = metadata["series"]
+                    if metadata.get("series_part"):
                         series_text += get_text(
                             "processing_series_part",
                             language,
-                            data["metadata"]["series_part"],
+                            metadata["series_part"],
                         )
-                    message += (
-                        get_text(
-                            "processing_series",
-                            language,
-                            series_text,
-                        )
-                        + "\n"
-                    )
                 else:
-                    message += (
-                        get_text(
-                            "processing_series",
-                            language,
-                            get_text("processing_standalone", language),
-                        )
-                        + "\n"
-                    )
+                    series_text = get_text("processing_standalone", language)
+                lines.append(get_text("processing_series", language, series_text))
 
-                message += get_text(
-                    "processing_moved_to",
-                    language,
-                    data["moved_to"],
+                lines.append(
+                    get_text("processing_moved_to", language, data["moved_to"])
                 )
+                message = "\n".join(lines)
 
-                await query.edit_message_text(message.strip())
+                await query.edit_message_text(message)
             else:
                 await query.edit_message_text(
                     get_text(
-                        "processing_error",
-                        language,
-                        data.get("message", get_text("error_unknown", language)),
+                        "processing_error", language, _error_message(data, language)
                     )
                 )
 
         except Exception as e:
-            self.logger.error(f"Error in process callback: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await query.edit_message_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                query.edit_message_text, e, language, "Error in process callback"
             )
 
     async def handle_language_callback(self, query, lang_code):
@@ -850,13 +861,8 @@ class AudiobookTelegramBot:
                 f"🌍 Your language has been changed to {lang_code.upper()}"
             )
         except Exception as e:
-            self.logger.error(f"Error changing language: {e}")
-            error_details = traceback.format_exc()
-            self.logger.error(f"Full traceback: {error_details}")
-            await query.edit_message_text(
-                get_text("error_generic", language, str(e))
-                + "\n\n"
-                + get_text("error_debug_info", language, type(e).__name__)
+            await self._reply_exception(
+                query.edit_message_text, e, language, "Error changing language"
             )
 
     async def auto_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -869,15 +875,14 @@ class AudiobookTelegramBot:
             await update.message.reply_text(get_text("auto_start", language))
 
             # Get initial list of pending audiobooks
-            init_response = requests.get(f"{self.api_url}/audiobooks/auto/batch/init")
-            init_data = init_response.json()
+            init_data = await self._api_get(
+                "/audiobooks/auto/batch/init", timeout=_API_SEARCH_TIMEOUT
+            )
 
-            if init_data["status"] != "success":
+            if not _ok(init_data):
                 await update.message.reply_text(
                     get_text(
-                        "auto_error",
-                        language,
-                        init_data.get("message", get_text("error_unknown", language)),
+                        "auto_error", language, _error_message(init_data, language)
                     )
                 )
                 return
@@ -898,9 +903,9 @@ class AudiobookTelegramBot:
 
             while True:
                 # Make progressive batch auto-processing request
-                response = requests.post(
-                    f"{self.api_url}/audiobooks/auto/batch/progressive",
-                    json={
+                data = await self._api_post(
+                    "/audiobooks/auto/batch/progressive",
+                    {
                         "current_index": current_index,
                         "processed_count": processed_count,
                         "failed_count": failed_count,
@@ -908,10 +913,10 @@ class AudiobookTelegramBot:
                         "results": results,
                         "audiobooks": audiobooks,
                     },
+                    timeout=_API_PROCESS_TIMEOUT,
                 )
-                data = response.json()
 
-                if data["status"] == "success":
+                if _ok(data):
                     if data.get("completed", False):
                         # Batch processing completed
                         processed = data.get("processed", processed_count)
@@ -919,29 +924,27 @@ class AudiobookTelegramBot:
                         skipped = data.get("skipped", skipped_count)
 
                         # Build final success message
-                        message = get_text("auto_complete", language) + "\n\n"
-                        message += get_text("auto_results", language) + "\n"
-                        message += (
-                            get_text("auto_processed", language, processed) + "\n"
-                        )
-                        message += get_text("auto_failed", language, failed) + "\n"
-                        message += get_text("auto_skipped", language, skipped) + "\n"
-                        message += get_text("auto_total", language, total) + "\n\n"
+                        lines = [
+                            get_text("auto_complete", language),
+                            "",
+                            get_text("auto_results", language),
+                            get_text("auto_processed", language, processed),
+                            get_text("auto_failed", language, failed),
+                            get_text("auto_skipped", language, skipped),
+                            get_text("auto_total", language, total),
+                            "",
+                        ]
 
                         if processed > 0:
-                            message += (
-                                get_text("auto_success_message", language) + "\n\n"
-                            )
+                            lines += (get_text("auto_success_message", language), "")
 
                         if failed > 0:
-                            message += (
-                                get_text("auto_failed_message", language) + "\n\n"
-                            )
+                            lines += (get_text("auto_failed_message", language), "")
 
                         if skipped > 0:
-                            message += (
-                                get_text("auto_skipped_message", language) + "\n\n"
-                            )
+                            lines += (get_text("auto_skipped_message", language), "")
+
+                        message = "\n".join(lines)
 
                         await update.message.reply_text(message.strip())
                         break
@@ -977,11 +980,7 @@ class AudiobookTelegramBot:
                         current_index += 1
                 else:
                     await update.message.reply_text(
-                        get_text(
-                            "auto_error",
-                            language,
-                            data.get("message", get_text("error_unknown", language)),
-                        )
+                        get_text("auto_error", language, _error_message(data, language))
                     )
                     break
 
@@ -1008,38 +1007,37 @@ class AudiobookTelegramBot:
         status = result.get("status", "unknown")
 
         # Build progress header
-        message = (
-            get_text("auto_progress_book", language, current_index + 1, total) + "\n"
-        )
-        message += get_text("auto_progress_filename", language, filename) + "\n\n"
+        lines = [
+            get_text("auto_progress_book", language, current_index + 1, total),
+            get_text("auto_progress_filename", language, filename),
+            "",
+        ]
 
         # Add status-specific message
         if status == "processed":
             asin = result.get("asin", "unknown")
-            message += get_text("auto_progress_success", language) + "\n"
-            message += get_text("auto_progress_asin", language, asin) + "\n"
+            lines.append(get_text("auto_progress_success", language))
+            lines.append(get_text("auto_progress_asin", language, asin))
         elif status == "failed":
             reason = result.get("reason", "Unknown error")
-            message += get_text("auto_progress_failed", language) + "\n"
-            message += get_text("auto_progress_reason", language, reason) + "\n"
+            lines.append(get_text("auto_progress_failed", language))
+            lines.append(get_text("auto_progress_reason", language, reason))
         elif status == "skipped":
             reason = result.get("reason", "Unknown reason")
-            message += get_text("auto_progress_skipped", language) + "\n"
-            message += get_text("auto_progress_skipped_reason", language, reason) + "\n"
+            lines.append(get_text("auto_progress_skipped", language))
+            lines.append(get_text("auto_progress_skipped_reason", language, reason))
 
         # Add progress summary
-        message += f"\n{get_text('auto_progress_summary', language)}\n"
-        message += get_text("auto_progress_processed", language, processed_count) + "\n"
-        message += get_text("auto_progress_failed_count", language, failed_count) + "\n"
-        message += (
-            get_text("auto_progress_skipped_count", language, skipped_count) + "\n"
-        )
-        message += (
-            get_text("auto_progress_remaining", language, total - (current_index + 1))
-            + "\n"
+        lines += (
+            "",
+            get_text("auto_progress_summary", language),
+            get_text("auto_progress_processed", language, processed_count),
+            get_text("auto_progress_failed_count", language, failed_count),
+            get_text("auto_progress_skipped_count", language, skipped_count),
+            get_text("auto_progress_remaining", language, total - (current_index + 1)),
         )
 
-        return message
+        return "\n".join(lines)
 
     def run(self):
         """Run the Telegram bot"""
@@ -1060,9 +1058,15 @@ def main():
 
     args = parser.parse_args()
 
-    # Create and run bot
-    bot = AudiobookTelegramBot(args.api_url, args.token)
-    bot.run()
+    listener = setup_logging()
+    try:
+        # Create and run bot
+        bot = AudiobookTelegramBot(args.api_url, args.token)
+        bot.run()
+    finally:
+        # Flush queued log records before exiting
+        if listener is not None:
+            listener.stop()
 
 
 if __name__ == "__main__":
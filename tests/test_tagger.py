@@ -0,0 +1,61 @@
+"""Tests for AudibleTagger tagging"""
+
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+mp4 = pytest.importorskip("mutagen.mp4")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from tagger import AudibleTagger  # noqa: E402
+
+METADATA = {
+    "asin": "B0TEST0000",
+    "title": "Title",
+    "author": "Author",
+    "narrator": "Narrator",
+    "series": "Series",
+    "series_part": "1",
+    "description": "Description",
+    "release_date": "2020-01-01",
+    "publisher": "Publisher",
+    "genres": ["Fiction"],
+    "language": "english",
+    "is_adult_product": False,
+}
+
+
+def _atom(name: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + name + payload
+
+
+def _write_empty_m4b(path: Path) -> None:
+    """Write the smallest MP4 mutagen will open: ftyp plus a moov with mvhd"""
+    mvhd = _atom(b"mvhd", b"\0" * 4 + struct.pack(">IIII", 0, 0, 1000, 0) + b"\0" * 80)
+    path.write_bytes(_atom(b"ftyp", b"M4A \0\0\0\0M4A isom") + _atom(b"moov", mvhd))
+
+
+def test_retagging_identical_metadata_does_not_save(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    file_path = tmp_path / "book.m4b"
+    _write_empty_m4b(file_path)
+
+    saves = []
+    original_save = mp4.MP4.save
+
+    def counting_save(self, *args, **kwargs):
+        saves.append(file_path)
+        return original_save(self, *args, **kwargs)
+
+    monkeypatch.setattr(mp4.MP4, "save", counting_save)
+
+    with AudibleTagger() as tagger:
+        assert tagger.tag_with_mutagen(file_path, METADATA)
+        assert len(saves) == 1
+
+        # Same metadata again: every tag already matches, so nothing is written
+        assert tagger.tag_with_mutagen(file_path, METADATA)
+        assert len(saves) == 1